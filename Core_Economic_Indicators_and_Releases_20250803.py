@@ -1,178 +1,993 @@
 import dash
-from dash import dcc, html, Input, Output, State
+import flask
+from dash import dcc, html, Input, Output, State, MATCH
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.utils import PlotlyJSONEncoder
+from plotly.offline import get_plotlyjs
 import pandas as pd
+import numpy as np
 import base64
-from io import BytesIO
-import pandas_datareader.data as web
 import datetime
 from dateutil.relativedelta import relativedelta
 import requests
 import io
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 from dateutil.parser import parse
 import dash_bootstrap_components as dbc
 import dash_table
+import os
+import sys
+import argparse
+import json
+import sqlite3
+import time
+import threading
+import hashlib
+import random
+import uuid
+import functools
+from bisect import bisect_left
+from collections import OrderedDict
+from zoneinfo import ZoneInfo
+import zipfile
+import pickle
+import contextlib
+import multiprocessing
+from html import escape
+import logging
+import xlsxwriter
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError as FuturesTimeout
+from requests.adapters import HTTPAdapter
 
-# Fetch functions (unchanged)
-def fetch_fred_data(code, label, lookback=120, is_mom=False, is_yoy=False):
+# Local on-disk cache location (series store and other persisted artifacts)
+CACHE_DIR = os.environ.get('DASHBOARD_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache'))
+SERIES_DB_PATH = os.path.join(CACHE_DIR, 'series_store.sqlite')
+# Minimum seconds between upstream checks for a series that already covers the requested window
+STORE_REFRESH_SECONDS = int(os.environ.get('DASHBOARD_STORE_REFRESH_SECONDS', 3600))
+# Months before the last stored observation that every routine refresh asks for again, to pick up revisions
+STORE_REVISION_MONTHS = int(os.environ.get('DASHBOARD_STORE_REVISION_MONTHS', 12))
+# Series refreshed by the release scheduler only need a rare safety-net check in between releases
+SCHEDULED_REFRESH_SECONDS = int(os.environ.get('DASHBOARD_SCHEDULED_REFRESH_SECONDS', 7 * 86400))
+# Series id -> sorted release dates, for series the release scheduler owns
+scheduled_series = {}
+
+# Pooled keep-alive HTTP session shared by all fetchers, with a per-source timeout (seconds)
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+HTTP_SESSION.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+SOURCE_TIMEOUTS = {'fred': 15, 'bls': 60, 'investing': 15, 'wikipedia': 15}
+# Total wall-clock budget for one get_data refresh; series still pending are served stale or marked unavailable
+FETCH_DEADLINE_SECONDS = float(os.environ.get('DASHBOARD_FETCH_DEADLINE_SECONDS', 30))
+FETCH_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix='fetch')
+
+# Upstream endpoints; overridable so the offline benchmark suite can point them at its stand-in server
+FRED_GRAPH_URL = os.environ.get('DASHBOARD_FRED_URL', 'https://fred.stlouisfed.org/graph/fredgraph.csv')
+BLS_CE_URL = os.environ.get('DASHBOARD_BLS_URL', 'https://download.bls.gov/pub/time.series/ce/ce.data.0.Current')
+ISM_URL = os.environ.get('DASHBOARD_ISM_URL', 'https://www.investing.com/economic-calendar/ism-manufacturing-pmi-173')
+FOMC_URL = os.environ.get('DASHBOARD_FOMC_URL', 'https://en.wikipedia.org/wiki/History_of_Federal_Open_Market_Committee_actions')
+
+# Instrumentation: in-process counters and histograms, exposed in Prometheus text format at /metrics,
+# plus one-line JSON structured logs on the 'dashboard' logger
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+SIZE_BUCKETS = (1e3, 1e4, 1e5, 1e6, 1e7, 1e8)
+metric_help = {
+    'dashboard_upstream_request_seconds': ('histogram', 'Upstream HTTP request latency by source'),
+    'dashboard_upstream_bytes_total': ('counter', 'Bytes downloaded from upstream by source'),
+    'dashboard_upstream_errors_total': ('counter', 'Failed upstream requests by source'),
+    'dashboard_fetch_seconds': ('histogram', 'Per-indicator fetch latency, including store reads'),
+    'dashboard_fetch_failures_total': ('counter', 'Indicator fetches that returned no data'),
+    'dashboard_series_status_total': ('counter', 'Series resolved per status (ok, stale, unavailable)'),
+    'dashboard_callback_seconds': ('histogram', 'Dash callback latency'),
+    'dashboard_callback_errors_total': ('counter', 'Dash callbacks that raised'),
+    'dashboard_cache_requests_total': ('counter', 'Cache lookups by cache and result (hit or miss)'),
+    'dashboard_cache_hit_ratio': ('gauge', 'Hit ratio per cache since start'),
+    'dashboard_figure_payload_bytes': ('histogram', 'Serialized size of a sample of figure responses, as plain JSON and in the wire format'),
+    'dashboard_export_bytes': ('histogram', 'Size of served export artifacts by format'),
+    'dashboard_lock_wait_seconds': ('histogram', 'Time spent waiting on cross-process locks'),
+    'dashboard_circuit_rejections_total': ('counter', 'Upstream requests failed fast by an open circuit breaker'),
+    'dashboard_revalidations_total': ('counter', 'Background stale-while-revalidate refreshes by result'),
+}
+_counters = {}
+_histograms = {}
+_metrics_lock = threading.Lock()
+
+logger = logging.getLogger('dashboard')
+if not logger.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    logger.addHandler(_log_handler)
+    logger.setLevel(os.environ.get('DASHBOARD_LOG_LEVEL', 'INFO'))
+
+def log_event(event, level=logging.INFO, **fields):
+    if logger.isEnabledFor(level):
+        logger.log(level, json.dumps({'event': event, **fields}, default=str))
+
+def _metric_key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+def inc_counter(name, value=1, **labels):
+    key = _metric_key(name, labels)
+    with _metrics_lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+def observe(name, value, buckets=LATENCY_BUCKETS, **labels):
+    key = _metric_key(name, labels)
+    with _metrics_lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = {'buckets': buckets, 'counts': [0] * len(buckets), 'sum': 0.0, 'count': 0}
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                histogram['counts'][i] += 1
+        histogram['sum'] += value
+        histogram['count'] += 1
+
+def count_cache(cache, hit):
+    inc_counter('dashboard_cache_requests_total', cache=cache, result='hit' if hit else 'miss')
+
+def _label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_label_value(v)}"' for k, v in pairs) + '}'
+
+def render_metrics():
+    with _metrics_lock:
+        counters = dict(_counters)
+        histograms = {k: {**v, 'counts': list(v['counts'])} for k, v in _histograms.items()}
+    # Hit ratios derived from the cache request counters
+    totals = {}
+    for (name, labels), value in counters.items():
+        if name == 'dashboard_cache_requests_total':
+            label_map = dict(labels)
+            hits, total = totals.get(label_map['cache'], (0, 0))
+            totals[label_map['cache']] = (hits + (value if label_map['result'] == 'hit' else 0), total + value)
+    gauges = {_metric_key('dashboard_cache_hit_ratio', {'cache': cache}): hits / total for cache, (hits, total) in totals.items() if total}
+    lines = []
+    for name, (kind, text) in metric_help.items():
+        series = [(k, v) for k, v in list(counters.items()) + list(gauges.items()) + list(histograms.items()) if k[0] == name]
+        if not series:
+            continue
+        lines.append(f'# HELP {name} {text}')
+        lines.append(f'# TYPE {name} {kind}')
+        for (_, labels), value in sorted(series, key=lambda item: item[0][1]):
+            if kind != 'histogram':
+                lines.append(f'{name}{_format_labels(labels)} {value}')
+                continue
+            for bound, count in zip(value['buckets'], value['counts']):
+                lines.append(f'{name}_bucket{_format_labels(labels, [("le", bound)])} {count}')
+            lines.append(f'{name}_bucket{_format_labels(labels, [("le", "+Inf")])} {value["count"]}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {value["sum"]}')
+            lines.append(f'{name}_count{_format_labels(labels)} {value["count"]}')
+    return '\n'.join(lines) + '\n'
+
+# Time a Dash callback into dashboard_callback_seconds (applied beneath @app.callback)
+def instrumented(callback_name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if not isinstance(e, dash.exceptions.PreventUpdate):
+                    inc_counter('dashboard_callback_errors_total', callback=callback_name)
+                    log_event('callback_error', logging.ERROR, callback=callback_name, error=str(e))
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                observe('dashboard_callback_seconds', elapsed, callback=callback_name)
+                log_event('callback', logging.DEBUG, callback=callback_name, seconds=round(elapsed, 4))
+        return wrapper
+    return decorator
+
+# Cross-process coordination for multi-worker deployments: flock()ed lock files under CACHE_DIR/locks,
+# so only one worker (and one thread within it) runs a given upstream sync or data build at a time.
+# Without fcntl (Windows) the locks only exclude threads of the current process.
+LOCK_DIR = os.path.join(CACHE_DIR, 'locks')
+_thread_locks = {}
+_thread_locks_guard = threading.Lock()
+
+def _lock_path(name):
+    os.makedirs(LOCK_DIR, exist_ok=True)
+    return os.path.join(LOCK_DIR, re.sub(r'[^A-Za-z0-9_.-]', '_', name) + '.lock')
+
+@contextlib.contextmanager
+def shared_lock(name):
+    with _thread_locks_guard:
+        thread_lock = _thread_locks.setdefault(name, threading.Lock())
+    start = time.perf_counter()
+    with thread_lock:
+        if fcntl is None:
+            observe('dashboard_lock_wait_seconds', time.perf_counter() - start, lock=name.split('-')[0])
+            yield
+            return
+        with open(_lock_path(name), 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            observe('dashboard_lock_wait_seconds', time.perf_counter() - start, lock=name.split('-')[0])
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+# Non-blocking, process-lifetime lock for leader election; returns the held handle or None
+def try_process_lock(name):
+    if fcntl is None:
+        return True
+    f = open(_lock_path(name), 'a')
     try:
-        extra = 12 if is_yoy else 1 if is_mom else 0
-        start = datetime.datetime.now() - relativedelta(months=lookback + extra)
-        data = web.DataReader(code, 'fred', start, datetime.datetime.now())
-        data = data.reset_index()
-        data.columns = ['Date', 'Value']
-        if is_yoy:
-            data[label] = data['Value'].pct_change(periods=12) * 100
-        elif is_mom:
-            data[label] = data['Value'].pct_change() * 100
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return None
+    return f
+
+def _write_atomic(path, write, mode='wb'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_path, mode) as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+# HTTP cache under all fetchers: the last body and its validators (ETag / Last-Modified) per URL, on disk
+# under CACHE_DIR/http. Requests carry If-None-Match / If-Modified-Since, and a 304 is answered from the
+# cached body, so an unchanged source costs one round trip and no transfer.
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, 'http')
+# Entries kept (least recently stored or revalidated go first); FRED batch URLs change with every cosd
+HTTP_CACHE_SIZE = 256
+# Per-source circuit breaker: each consecutive failure (connection error, timeout, 429 or 5xx) opens the
+# circuit for an exponentially growing backoff, during which requests fail fast without touching upstream.
+# Once it expires, a single probe request goes through and either closes it or reopens it for longer.
+BREAKER_BASE_SECONDS = 5
+BREAKER_MAX_SECONDS = 900
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def _breaker_check(source):
+    now = time.time()
+    with _breakers_lock:
+        breaker = _breakers.get(source)
+        if breaker is None:
+            return
+        if now >= breaker['open_until']:
+            # Half-open: let this request probe, fail fast for the others until it resolves
+            breaker['open_until'] = now + SOURCE_TIMEOUTS[source]
+            return
+        wait = breaker['open_until'] - now
+    inc_counter('dashboard_circuit_rejections_total', source=source)
+    raise requests.ConnectionError(f'{source} circuit open for another {wait:.0f}s after {breaker["failures"]} failure(s)')
+
+def _breaker_record(source, ok):
+    with _breakers_lock:
+        if ok:
+            _breakers.pop(source, None)
+            return
+        breaker = _breakers.setdefault(source, {'failures': 0, 'open_until': 0})
+        breaker['failures'] += 1
+        backoff = min(BREAKER_BASE_SECONDS * 2 ** (breaker['failures'] - 1), BREAKER_MAX_SECONDS)
+        breaker['open_until'] = time.time() + backoff
+    log_event('circuit_open', logging.WARNING, source=source, failures=breaker['failures'], backoff=backoff)
+
+def _http_cache_paths(cache_url):
+    key = hashlib.sha1(cache_url.encode()).hexdigest()
+    return os.path.join(HTTP_CACHE_DIR, key + '.json'), os.path.join(HTTP_CACHE_DIR, key + '.body')
+
+def _http_cache_meta(cache_url):
+    try:
+        with open(_http_cache_paths(cache_url)[0]) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+# Record a response's validators, and its body unless the caller keeps its own copy (streamed downloads)
+def remember_response(response, cache_url=None, keep_body=True):
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+    meta_path, body_path = _http_cache_paths(cache_url or response.url)
+    try:
+        if keep_body:
+            _write_atomic(body_path, lambda f: f.write(response.content))
+        meta = {'etag': etag, 'last_modified': last_modified, 'encoding': response.encoding,
+                'content_type': response.headers.get('Content-Type'), 'stored_at': time.time()}
+        _write_atomic(meta_path, lambda f: json.dump(meta, f), mode='w')
+        _prune_http_cache()
+    except OSError as e:
+        log_event('http_cache_write_failed', logging.WARNING, url=cache_url or response.url, error=str(e))
+
+def _prune_http_cache():
+    mtimes = {}
+    for name in os.listdir(HTTP_CACHE_DIR):
+        if name.endswith('.json'):
+            try:
+                mtimes[name[:-len('.json')]] = os.path.getmtime(os.path.join(HTTP_CACHE_DIR, name))
+            except OSError:
+                pass
+    for key in sorted(mtimes, key=mtimes.get)[:-HTTP_CACHE_SIZE]:
+        for suffix in ('.json', '.body'):
+            try:
+                os.remove(os.path.join(HTTP_CACHE_DIR, key + suffix))
+            except FileNotFoundError:
+                pass
+
+# A 304 restarts the cached entry's freshness and may carry updated validators
+def _touch_http_cache(cache_url, meta, response):
+    meta = {**meta, 'stored_at': time.time()}
+    meta['etag'] = response.headers.get('ETag') or meta.get('etag')
+    meta['last_modified'] = response.headers.get('Last-Modified') or meta.get('last_modified')
+    try:
+        _write_atomic(_http_cache_paths(cache_url)[0], lambda f: json.dump(meta, f), mode='w')
+    except OSError as e:
+        log_event('http_cache_write_failed', logging.WARNING, url=cache_url, error=str(e))
+
+def _cached_response(cache_url, meta):
+    try:
+        with open(_http_cache_paths(cache_url)[1], 'rb') as f:
+            body = f.read()
+    except OSError:
+        return None
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.url = cache_url
+    response.encoding = meta.get('encoding')
+    response.headers['Content-Type'] = meta.get('content_type') or ''
+    response.from_cache = True
+    return response
+
+# Background revalidation, one in flight per key
+REVALIDATE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='revalidate')
+_revalidating = set()
+_revalidating_lock = threading.Lock()
+
+def revalidate_in_background(key, refresh, *args):
+    with _revalidating_lock:
+        if key in _revalidating:
+            return
+        _revalidating.add(key)
+
+    def run():
+        try:
+            refresh(*args)
+            inc_counter('dashboard_revalidations_total', result='ok')
+        except Exception as e:
+            inc_counter('dashboard_revalidations_total', result='failed')
+            log_event('revalidate_failed', logging.WARNING, key=str(key), error=str(e))
+        finally:
+            with _revalidating_lock:
+                _revalidating.discard(key)
+    REVALIDATE_POOL.submit(run)
+
+# GET through the pooled session, the circuit breaker and the HTTP cache.
+# conditional: send the stored validators (default: whenever a cached body exists; streamed callers
+# pass True only when they still hold the previous download, and handle the 304 themselves).
+def http_get(url, source, conditional=None, **kwargs):
+    stream = kwargs.get('stream', False)
+    cache_url = requests.Request('GET', url, params=kwargs.get('params')).prepare().url
+    meta = _http_cache_meta(cache_url)
+    if conditional is None:
+        conditional = meta is not None and not stream and os.path.exists(_http_cache_paths(cache_url)[1])
+    headers = dict(kwargs.pop('headers', None) or {})
+    if conditional and meta is not None:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+    _breaker_check(source)
+    start = time.perf_counter()
+    try:
+        response = HTTP_SESSION.get(url, timeout=SOURCE_TIMEOUTS[source], headers=headers, **kwargs)
+    except Exception as e:
+        _breaker_record(source, False)
+        inc_counter('dashboard_upstream_errors_total', source=source)
+        log_event('upstream_error', logging.WARNING, source=source, url=url, error=str(e))
+        raise
+    elapsed = time.perf_counter() - start
+    observe('dashboard_upstream_request_seconds', elapsed, source=source)
+    _breaker_record(source, response.status_code < 500 and response.status_code != 429)
+    if response.status_code >= 400:
+        inc_counter('dashboard_upstream_errors_total', source=source)
+    log_event('upstream_request', source=source, status=response.status_code, seconds=round(elapsed, 4),
+              bytes=None if stream else len(response.content))
+    if conditional:
+        count_cache('http', response.status_code == 304)
+    if response.status_code == 304 and meta is not None:
+        _touch_http_cache(cache_url, meta, response)
+        if stream:
+            return response
+        cached = _cached_response(cache_url, meta)
+        if cached is not None:
+            return cached
+    # Streamed bodies are counted by the reader as they arrive, and remembered by it once complete
+    if not stream:
+        inc_counter('dashboard_upstream_bytes_total', len(response.content), source=source)
+        if response.status_code == 200:
+            remember_response(response, cache_url)
+    return response
+
+# Series store: one SQLite table per series ID holding raw (date, value) observations,
+# plus a meta table recording how far back each series is covered and when upstream was last asked
+def _store_connect():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(SERIES_DB_PATH, timeout=30)
+    conn.execute('CREATE TABLE IF NOT EXISTS _series_meta (series_id TEXT PRIMARY KEY, covered_from TEXT, checked_at REAL)')
+    conn.execute('CREATE TABLE IF NOT EXISTS _release_missed (series_id TEXT PRIMARY KEY, missed_at REAL)')
+    return conn
+
+def _store_table(series_id):
+    return 'series_' + re.sub(r'[^A-Za-z0-9_]', '_', series_id)
+
+def store_read(series_id, start=None):
+    table = _store_table(series_id)
+    with _store_connect() as conn:
+        conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" (date TEXT PRIMARY KEY, value)')
+        if start is None:
+            rows = conn.execute(f'SELECT date, value FROM "{table}" ORDER BY date').fetchall()
         else:
-            data[label] = data['Value']
-        data = data.dropna()[['Date', label]]
-        start_date = datetime.datetime.now() - relativedelta(months=lookback)
-        data = data[data['Date'] >= start_date]
-        return data
+            rows = conn.execute(f'SELECT date, value FROM "{table}" WHERE date >= ? ORDER BY date', (start.strftime('%Y-%m-%d'),)).fetchall()
+    df = pd.DataFrame(rows, columns=['Date', 'Value'])
+    df['Date'] = pd.to_datetime(df['Date'])
+    return df
+
+# Writes also record vintages: only observations that are new or differ from the stored value get a
+# (date, vintage, value) row, stamped with today's date, so the vintage table is delta-encoded
+def store_write(series_id, df):
+    table = _store_table(series_id)
+    rows = list(zip(pd.to_datetime(df['Date']).dt.strftime('%Y-%m-%d'), df['Value'].tolist()))
+    vintage = datetime.date.today().strftime('%Y-%m-%d')
+    with _store_connect() as conn:
+        conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" (date TEXT PRIMARY KEY, value)')
+        vintage_table = _vintage_create(conn, series_id)
+        current = dict(conn.execute(f'SELECT date, value FROM "{table}" WHERE date >= ?', (min(row[0] for row in rows),)).fetchall()) if rows else {}
+        conn.executemany(f'INSERT OR REPLACE INTO "{table}" (date, value) VALUES (?, ?)', rows)
+        conn.executemany(f'INSERT OR REPLACE INTO "{vintage_table}" (date, vintage, value) VALUES (?, ?, ?)',
+                         [(date, vintage, value) for date, value in rows if date not in current or current[date] != value])
+
+# Point-in-time vintage store: vintage_<series> holds every value each observation has had, keyed by
+# (date, vintage). Stores that predate it are seeded with their current values as of the last upstream check.
+def _vintage_create(conn, series_id):
+    table = _store_table(series_id)
+    vintage_table = 'vintage_' + table[len('series_'):]
+    conn.execute(f'CREATE TABLE IF NOT EXISTS "{vintage_table}" (date TEXT, vintage TEXT, value, PRIMARY KEY (date, vintage)) WITHOUT ROWID')
+    if conn.execute(f'SELECT 1 FROM "{vintage_table}" LIMIT 1').fetchone() is None:
+        conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" (date TEXT PRIMARY KEY, value)')
+        row = conn.execute('SELECT checked_at FROM _series_meta WHERE series_id = ?', (series_id,)).fetchone()
+        seeded = datetime.date.fromtimestamp(row[0]) if row and row[0] else datetime.date.today()
+        conn.execute(f'INSERT INTO "{vintage_table}" (date, vintage, value) SELECT date, ?, value FROM "{table}"', (seeded.strftime('%Y-%m-%d'),))
+    return vintage_table
+
+# In-memory index per series: rows sorted by (date, vintage) as numpy arrays plus the start of each
+# date's run, reloaded only when the store file changes. As-of and revision queries are pure array ops.
+_vintage_cache = {}
+_vintage_cache_lock = threading.Lock()
+
+def vintage_index(series_id):
+    try:
+        stamp = os.stat(SERIES_DB_PATH).st_mtime_ns
+    except OSError:
+        stamp = None
+    with _vintage_cache_lock:
+        index = _vintage_cache.get(series_id)
+    if index is not None and index['stamp'] == stamp:
+        return index
+    with _store_connect() as conn:
+        vintage_table = _vintage_create(conn, series_id)
+        rows = conn.execute(f'SELECT date, vintage, value FROM "{vintage_table}" ORDER BY date, vintage').fetchall()
+    dates = np.array([row[0] for row in rows], dtype='datetime64[D]')
+    starts = np.flatnonzero(np.r_[True, dates[1:] != dates[:-1]]) if len(rows) else np.array([], dtype=np.int64)
+    ends = np.r_[starts[1:], len(rows)].astype(np.int64) if len(rows) else starts
+    index = {
+        'dates': dates,
+        'vintages': np.array([row[1] for row in rows], dtype='datetime64[D]'),
+        'values': np.array([row[2] for row in rows]),
+        'starts': starts,
+        'ends': ends,
+        'stamp': os.stat(SERIES_DB_PATH).st_mtime_ns,
+    }
+    with _vintage_cache_lock:
+        _vintage_cache[series_id] = index
+    return index
+
+# The series as it was known on as_of: for each observation, the last vintage on or before that date
+def series_as_of(series_id, as_of):
+    index = vintage_index(series_id)
+    if not len(index['starts']):
+        return pd.DataFrame(columns=['Date', 'Value'])
+    known = np.add.reduceat((index['vintages'] <= np.datetime64(pd.Timestamp(as_of).date(), 'D')).astype(np.int64), index['starts'])
+    keep = known > 0
+    positions = (index['starts'] + known - 1)[keep]
+    return pd.DataFrame({'Date': pd.to_datetime(index['dates'][positions]), 'Value': index['values'][positions]})
+
+# Per observation: first print, latest value, number of distinct estimates and the total revision.
+# Vintages are stamped when the store sees a value, so observations already published when tracking began
+# (first vintage = the table's earliest) carry their revised value as 'First'; 'Tracked' is False for those.
+def series_revisions(series_id):
+    index = vintage_index(series_id)
+    starts, ends = index['starts'], index['ends']
+    first = pd.to_numeric(pd.Series(index['values'][starts]), errors='coerce')
+    latest = pd.to_numeric(pd.Series(index['values'][ends - 1]), errors='coerce')
+    tracked = index['vintages'][starts] > index['vintages'].min() if len(starts) else np.array([], dtype=bool)
+    return pd.DataFrame({'Date': pd.to_datetime(index['dates'][starts]), 'First': first, 'Latest': latest,
+                         'Estimates': ends - starts, 'Revision': latest - first, 'Tracked': tracked})
+
+def store_last_date(series_id):
+    table = _store_table(series_id)
+    with _store_connect() as conn:
+        conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" (date TEXT PRIMARY KEY, value)')
+        row = conn.execute(f'SELECT MAX(date) FROM "{table}"').fetchone()
+    return pd.Timestamp(row[0]) if row and row[0] else None
+
+def _store_meta(series_id):
+    with _store_connect() as conn:
+        row = conn.execute('SELECT covered_from, checked_at FROM _series_meta WHERE series_id = ?', (series_id,)).fetchone()
+    return (pd.Timestamp(row[0]), row[1]) if row else None
+
+def _store_set_meta(series_id, covered_from, checked_at):
+    with _store_connect() as conn:
+        conn.execute('INSERT OR REPLACE INTO _series_meta (series_id, covered_from, checked_at) VALUES (?, ?, ?)',
+                     (series_id, covered_from.strftime('%Y-%m-%d'), checked_at))
+
+# Force the next sync_series call for this series to ask upstream
+def store_expire(series_id):
+    meta = _store_meta(series_id)
+    if meta is not None:
+        _store_set_meta(series_id, meta[0], 0)
+
+# Scheduled series whose last release refresh gave up without a new print. Kept in the store, so every
+# worker (not only the scheduler's leader) and the next leader after a restart see it.
+def _release_missed(series_id):
+    with _store_connect() as conn:
+        return conn.execute('SELECT 1 FROM _release_missed WHERE series_id = ?', (series_id,)).fetchone() is not None
+
+def _set_release_missed(series_ids, missed):
+    with _store_connect() as conn:
+        if missed:
+            conn.executemany('INSERT OR REPLACE INTO _release_missed (series_id, missed_at) VALUES (?, ?)',
+                             [(series_id, time.time()) for series_id in series_ids])
+        else:
+            conn.executemany('DELETE FROM _release_missed WHERE series_id = ?', [(series_id,) for series_id in series_ids])
+
+# The scheduler only stands in for routine checks while the calendar has a release ahead for the series
+# and its last scheduled refresh found the new print
+def _refresh_seconds(series_id, now):
+    releases = scheduled_series.get(series_id)
+    if not releases or releases[-1] < datetime.date.fromtimestamp(now) or _release_missed(series_id):
+        return STORE_REFRESH_SECONDS
+    return SCHEDULED_REFRESH_SECONDS
+
+# Bring the stored series up to date and return observations on/after start.
+# download(since) must return a DataFrame with Date/Value columns for observations on/after since.
+# Upstream is only asked for the full window when the store does not yet cover start; otherwise
+# only for the last STORE_REVISION_MONTHS before the last stored date onwards (so revisions to recent
+# prints, e.g. NFP's two prior months, reach the store and its vintages), and at most every STORE_REFRESH_SECONDS
+# (SCHEDULED_REFRESH_SECONDS while the release scheduler owns the series, see _refresh_seconds).
+# Concurrent syncs of the same series, in any worker, collapse into one upstream request: the
+# others wait on the series lock, re-check the meta table and find it fresh.
+# Sources that only carry recent history (partial) cannot backfill on demand: a window reaching before
+# the stored rows is retried with the routine refresh instead of on every call.
+def _sync_since(series_id, start, meta, now, partial=False):
+    if meta is None or (start < meta[0] and not partial):
+        return start
+    if now - meta[1] >= _refresh_seconds(series_id, now):
+        if start < meta[0]:
+            return start
+        last = store_last_date(series_id)
+        return max(meta[0], last - relativedelta(months=STORE_REVISION_MONTHS)) if last is not None else start
+    return None
+
+# Stale-while-revalidate: a routine refresh of a series that already covers the window runs in the
+# background while the stored rows are served; backfills and store_expire()d series sync inline
+def _covers(meta, start, partial=False):
+    return meta is not None and (start >= meta[0] or partial) and meta[1] > 0
+
+# A download may report the earliest date it actually holds in attrs['covered_from'] (partial sources);
+# otherwise it is taken to cover everything from the requested start
+def _sync_series_locked(series_id, start, download, partial=False):
+    with shared_lock('sync-' + series_id):
+        meta = _store_meta(series_id)
+        now = time.time()
+        since = _sync_since(series_id, start, meta, now, partial)
+        try:
+            if since is not None:
+                fresh = download(since)
+                covered_from = max(start, fresh.attrs.get('covered_from', start))
+                store_write(series_id, fresh.dropna(subset=['Date']))
+                _store_set_meta(series_id, covered_from if meta is None else min(covered_from, meta[0]), now)
+        except Exception as e:
+            # Serve whatever is stored when upstream is unavailable
+            log_event('upstream_sync_failed', logging.WARNING, series=series_id, error=str(e))
+
+def sync_series(series_id, start, download, partial=False):
+    start = pd.Timestamp(start).normalize()
+    meta = _store_meta(series_id)
+    if _sync_since(series_id, start, meta, time.time(), partial) is not None:
+        if _covers(meta, start, partial):
+            revalidate_in_background(('sync', series_id), _sync_series_locked, series_id, start, download, partial)
+        else:
+            _sync_series_locked(series_id, start, download, partial)
+    return store_read(series_id, start)
+
+# Batched FRED download: every FRED series is pulled through one multi-id fredgraph.csv request
+# (split into FRED_BATCH_SIZE groups), each id with its own observation start (cosd)
+FRED_BATCH_SIZE = 20
+
+def download_fred_batch(since_by_code):
+    codes = list(since_by_code)
+    response = http_get(FRED_GRAPH_URL, 'fred', params={
+        'id': ','.join(codes),
+        'cosd': ','.join(since_by_code[code].strftime('%Y-%m-%d') for code in codes),
+    })
+    response.raise_for_status()
+    return parse_fred_batch(response.text, codes)
+
+def parse_fred_batch(text, codes):
+    df = pd.read_csv(io.StringIO(text), na_values=['.'])
+    df['Date'] = pd.to_datetime(df['observation_date'], errors='coerce')
+    # A code the response has no column for simply gets no rows
+    values = df.reindex(columns=codes).apply(pd.to_numeric, errors='coerce')
+    # One long frame (Date, code, Value) with the blanks from mixed frequencies dropped
+    long = values.set_index(df['Date']).stack().reset_index()
+    long.columns = ['Date', 'code', 'Value']
+    long = long.dropna()
+    return {code: group[['Date', 'Value']] for code, group in long.groupby('code')}
+
+# Batched counterpart of sync_series for FRED codes: same coverage and refresh rules,
+# but all codes that need upstream share one request
+def _fred_pending(codes, start, now):
+    metas = {code: _store_meta(code) for code in codes}
+    pending = {code: _sync_since(code, start, metas[code], now) for code in codes}
+    return {code: since for code, since in pending.items() if since is not None}, metas
+
+def sync_fred_batch(codes, start):
+    start = pd.Timestamp(start).normalize()
+    pending, metas = _fred_pending(codes, start, time.time())
+    if not pending:
+        return
+    if all(_covers(metas[code], start) for code in pending):
+        revalidate_in_background(('sync-fred', tuple(codes), start), _sync_fred_locked, codes, start)
+    else:
+        _sync_fred_locked(codes, start)
+
+def _sync_fred_locked(codes, start):
+    with shared_lock('sync-fred'):
+        now = time.time()
+        pending, metas = _fred_pending(codes, start, now)
+        _sync_fred_pending(pending, metas, start, now)
+
+def _sync_fred_pending(pending, metas, start, now):
+    pending_codes = list(pending)
+    for i in range(0, len(pending_codes), FRED_BATCH_SIZE):
+        chunk = {code: pending[code] for code in pending_codes[i:i + FRED_BATCH_SIZE]}
+        try:
+            fresh = download_fred_batch(chunk)
+        except Exception as e:
+            log_event('upstream_sync_failed', logging.WARNING, series=list(chunk), error=str(e))
+            continue
+        for code in chunk:
+            if code in fresh:
+                store_write(code, fresh[code])
+            meta = metas[code]
+            _store_set_meta(code, start if meta is None else min(start, meta[0]), now)
+
+# Indicator registry: key -> source, series ID, label (column name), transform, native frequency
+# and chart type. Drives fetch_tasks, the FRED batch, the indicator panel and the chart specs.
+transform_extra_months = {'yoy': 12, 'mom': 1, 'diff': 1}
+periods_per_year = {'W': 52, 'M': 12, 'Q': 4}
+
+def _lookback_start(lookback, transform=None):
+    return datetime.datetime.now() - relativedelta(months=lookback + transform_extra_months.get(transform, 0))
+
+# Indicator panel: stored FRED series as one wide, date-indexed frame per native frequency, with
+# every derived measure computed as whole-frame column operations in a single pass
+def derive_measures(wide, freq):
+    periods = periods_per_year[freq]
+    change = wide.pct_change(fill_method=None)
+    return {
+        'level': wide,
+        'diff': wide.diff(),
+        'mom': change * 100,
+        'yoy': wide.pct_change(periods=periods, fill_method=None) * 100,
+        'annualized': ((1 + change) ** periods - 1) * 100,
+        'zscore': (wide - wide.mean()) / wide.std(),
+    }
+
+def build_panel(codes, lookback=120):
+    start = pd.Timestamp(_lookback_start(lookback, 'yoy')).normalize()
+    specs = {spec['series']: spec for spec in indicators.values() if spec['series'] in codes}
+    panel = {}
+    for freq in periods_per_year:
+        group = [code for code in codes if specs[code]['freq'] == freq]
+        if not group:
+            continue
+        wide = pd.concat({code: store_read(code, start).set_index('Date')['Value'] for code in group}, axis=1).sort_index()
+        wide = wide.apply(pd.to_numeric, errors='coerce') * pd.Series({code: specs[code].get('scale', 1) for code in group})
+        panel[freq] = derive_measures(wide, freq)
+    return panel
+
+def sync_and_build_panel(codes, lookback=120):
+    sync_fred_batch(codes, _lookback_start(lookback, 'yoy'))
+    return build_panel(codes, lookback)
+
+# Fetch functions (read through the local series store)
+def fetch_fred_indicator(key, lookback=120, panel=None):
+    spec = indicators[key]
+    try:
+        panel = sync_and_build_panel([spec['series']], lookback) if panel is None else panel.result()
+        values = panel[spec['freq']][spec['transform'] or 'level'][spec['series']].dropna()
+        data = pd.DataFrame({'Date': values.index, spec['label']: values.values})
+        return data[data['Date'] >= _lookback_start(lookback)].reset_index(drop=True)
     except Exception as e:
-        print(f'Fetch failed for {label}: {e}')
+        log_event('fetch_failed', logging.WARNING, indicator=key, error=str(e))
         return pd.DataFrame()
 
+# BLS CE bulk file: streamed to disk in chunks while building a byte-offset index per series_id,
+# so only the requested series are ever parsed and later lookups seek straight to their rows
+BLS_CE_PATH = os.path.join(CACHE_DIR, 'ce.data.0.Current')
+BLS_CE_INDEX_PATH = BLS_CE_PATH + '.index.json'
+BLS_REFRESH_SECONDS = int(os.environ.get('DASHBOARD_BLS_REFRESH_SECONDS', 86400))
+
+def _bls_parse_lines(lines):
+    records = []
+    for line in lines:
+        fields = line.decode('utf-8', 'replace').split('\t')
+        if len(fields) < 4:
+            continue
+        period = fields[2].strip()
+        # Skip header and annual averages (M13)
+        if not re.fullmatch(r'M(0[1-9]|1[0-2])', period):
+            continue
+        records.append((datetime.datetime(int(fields[1]), int(period[1:]), 1), fields[3].strip()))
+    df = pd.DataFrame(records, columns=['Date', 'value'])
+    df['value'] = pd.to_numeric(df['value'], errors='coerce')
+    return df.dropna()
+
+# Stream the bulk file to disk, indexing every series and keeping only the rows of wanted series in memory
+def _bls_download(wanted):
+    response = http_get(BLS_CE_URL, 'bls', conditional=os.path.exists(BLS_CE_INDEX_PATH), stream=True,
+                        headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'})
+    if response.status_code == 304:
+        # Unchanged upstream: the file on disk is current again
+        response.close()
+        os.utime(BLS_CE_PATH)
+        return _bls_read_indexed(wanted)
+    response.raise_for_status()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    index = {}
+    rows = {series_id: [] for series_id in wanted}
+    offset = 0
+    tail = b''
+
+    def index_line(line, start):
+        series_id = line.split(b'\t', 1)[0].strip().decode('ascii', 'replace')
+        ranges = index.setdefault(series_id, [])
+        end = start + len(line) + 1
+        # Series are contiguous in the file, so ranges usually collapse into one [start, end) pair
+        if ranges and ranges[-1][1] == start:
+            ranges[-1][1] = end
+        else:
+            ranges.append([start, end])
+        if series_id in rows:
+            rows[series_id].append(line)
+
+    tmp_path = BLS_CE_PATH + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=1 << 20):
+            f.write(chunk)
+            inc_counter('dashboard_upstream_bytes_total', len(chunk), source='bls')
+            lines = (tail + chunk).split(b'\n')
+            tail = lines.pop()
+            for line in lines:
+                index_line(line, offset)
+                offset += len(line) + 1
+        if tail:
+            index_line(tail, offset)
+    with open(BLS_CE_INDEX_PATH + '.tmp', 'w') as f:
+        json.dump(index, f)
+    # Readers see either the old file and index or the new pair, never a mix
+    with shared_lock('swap-bls'):
+        os.replace(tmp_path, BLS_CE_PATH)
+        os.replace(BLS_CE_INDEX_PATH + '.tmp', BLS_CE_INDEX_PATH)
+    remember_response(response, BLS_CE_URL, keep_body=False)
+    return rows
+
+def _bls_read_indexed(wanted):
+    with shared_lock('swap-bls'):
+        with open(BLS_CE_INDEX_PATH) as f:
+            index = json.load(f)
+        rows = {}
+        with open(BLS_CE_PATH, 'rb') as f:
+            for series_id in wanted:
+                rows[series_id] = []
+                for start, end in index.get(series_id, []):
+                    f.seek(start)
+                    rows[series_id].extend(f.read(end - start).splitlines())
+    return rows
+
+def _bls_is_fresh():
+    try:
+        return os.path.exists(BLS_CE_INDEX_PATH) and time.time() - os.path.getmtime(BLS_CE_PATH) < BLS_REFRESH_SECONDS
+    except OSError:
+        return False
+
+def _bls_refresh():
+    with shared_lock('sync-bls'):
+        if not _bls_is_fresh():
+            _bls_download([])
+
+# Pull several CE series in one pass: returns {series_id: DataFrame(Date, value)} with the last `lookback` months.
+# A stale file on disk is served as is while a background download (conditional on its ETag) replaces it.
+def fetch_bls_series(series_ids, lookback=120):
+    if os.path.exists(BLS_CE_INDEX_PATH):
+        if not _bls_is_fresh():
+            revalidate_in_background(('sync', 'bls'), _bls_refresh)
+        rows = _bls_read_indexed(series_ids)
+    else:
+        with shared_lock('sync-bls'):
+            rows = _bls_read_indexed(series_ids) if os.path.exists(BLS_CE_INDEX_PATH) else _bls_download(series_ids)
+    return {series_id: _bls_parse_lines(lines).sort_values('Date').tail(lookback) for series_id, lines in rows.items()}
+
 def fetch_bls_csv(series_id, label, lookback=120):
-    url = 'https://download.bls.gov/pub/time.series/ce/ce.data.0.Current'
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'})
-        response.raise_for_status()
-        df = pd.read_csv(io.StringIO(response.text), delimiter='\t', on_bad_lines='skip')
-        df = df.apply(lambda col: col.str.strip() if col.dtype == 'object' else col)
-        df = df[df['series_id'] == series_id]
+        df = fetch_bls_series([series_id], lookback=lookback)[series_id]
         if df.empty:
             return pd.DataFrame()
-        df['month'] = df['period'].str.replace('M', '').astype(int)
-        df['Date'] = pd.to_datetime(df['year'].astype(str) + '-' + df['month'].astype(str) + '-01')
-        df = df.sort_values('Date').tail(lookback)
-        df = df[['Date', 'value']]
         df.columns = ['Date', label]
         return df
     except Exception as e:
-        print(f'Fetch failed for {label}: {e}')
+        log_event('fetch_failed', logging.WARNING, indicator=label, error=str(e))
         return pd.DataFrame()
 
-def fetch_ism_pmi(lookback=6):
-    url = 'https://www.investing.com/economic-calendar/ism-manufacturing-pmi-173'
-    try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        table = None
-        for t in soup.find_all('table'):
-            if 'Actual' in t.text:
-                table = t
-                break
-        if table:
-            rows = table.find_all('tr')[1:]
-            data = []
-            for row in rows:
-                cols = row.find_all('td')
-                if len(cols) >= 5:
-                    date_text = cols[0].text.strip()
-                    value = cols[2].text.strip()
-                    if value and value != '-':
-                        date_text = re.sub(r'\s+', ' ', date_text)
-                        match = re.search(r'\w{3} \d{2}, (\d{4}) \((\w{3})\)', date_text)
-                        if match:
-                            year, month = match.groups()
-                            full_date = f"{month} 1, {year}"
-                            data.append({'Date': pd.to_datetime(full_date), 'ISM Manufacturing PMI': value})
-            if data:
-                df = pd.DataFrame(data)
-                df['ISM Manufacturing PMI'] = pd.to_numeric(df['ISM Manufacturing PMI'], errors='coerce')
-                df = df.dropna().sort_values('Date').tail(lookback)
-                return df
+# ISM PMI history table: only the event-history table is built into a tree (SoupStrainer, lxml when
+# installed), and dates are derived from the release/reference months in one vectorized pass
+def _ism_table(text):
+    soup = BeautifulSoup(text, HTML_PARSER, parse_only=SoupStrainer('table', id=re.compile(r'^eventHistoryTable')))
+    table = soup.find('table')
+    if table is None:
+        # Markup changed: fall back to the first table with an Actual column
+        soup = BeautifulSoup(text, HTML_PARSER, parse_only=SoupStrainer('table'))
+        table = next((t for t in soup.find_all('table') if 'Actual' in t.get_text()), None)
+    return table
+
+def parse_ism_html(text, lookback=None):
+    table = _ism_table(text)
+    if table is None:
         return pd.DataFrame()
-    except Exception as e:
-        print(f'Fetch failed for ISM Manufacturing PMI: {e}')
+    cells = [[td.get_text(' ', strip=True) for td in row.find_all('td')] for row in table.find_all('tr')]
+    cells = [row for row in cells if len(row) >= 5]
+    if not cells:
         return pd.DataFrame()
+    release = pd.Series([row[0] for row in cells]).str.replace(r'\s+', ' ', regex=True)
+    parts = release.str.extract(r'(\w{3}) \d{2}, (\d{4}) \((\w{3})\)')
+    release_month = pd.to_datetime(parts[0], format='%b', errors='coerce').dt.month
+    reference_month = pd.to_datetime(parts[2], format='%b', errors='coerce').dt.month
+    # A January release reports December of the previous year
+    year = pd.to_numeric(parts[1], errors='coerce') - (reference_month > release_month)
+    dates = pd.to_datetime(pd.DataFrame({'year': year, 'month': reference_month, 'day': 1}), errors='coerce')
+    df = pd.DataFrame({'Date': dates, 'ISM Manufacturing PMI': pd.to_numeric(pd.Series([row[2] for row in cells]), errors='coerce')})
+    df = df.dropna().drop_duplicates('Date').sort_values('Date').reset_index(drop=True)
+    return df.tail(lookback) if lookback else df
 
-def fetch_fomc_rates(lookback=120):
-    url = 'https://en.wikipedia.org/wiki/History_of_Federal_Open_Market_Committee_actions'
-    try:
-        dfs = pd.read_html(url)
-        if not dfs:
-            raise ValueError("No tables found on page")
-        table = None
-        for df in dfs:
-            if 'Date' in df.columns and 'Fed. Funds Rate' in df.columns:
-                table = df
-                break
-        if table is None:
-            raise ValueError("Expected columns not found in any table")
-        data = table[['Date', 'Fed. Funds Rate']]
-        data = data.rename(columns={'Fed. Funds Rate': 'Rate Range %'})
-        data['Rate Range %'] = data['Rate Range %'].str.replace('%', '', regex=False).str.replace('–', '-', regex=False).str.strip()
-        data = data.dropna(subset=['Date', 'Rate Range %'])
-        data['Date'] = pd.to_datetime(data['Date'], errors='coerce')
-        data = data.dropna(subset=['Date'])
-        data = data.sort_values('Date')
-        start_date = pd.Timestamp.now() - relativedelta(months=lookback)
-        data = data[data['Date'] >= start_date]
-        return data
-    except Exception as e:
-        print(f'Fetch failed for FOMC Decisions: {e}')
-        return pd.DataFrame()
+# ISM PMI through the series store. The investing.com page only carries recent prints, so the store's
+# coverage starts at the earliest row parsed and grows as new prints are appended; longer windows show
+# what has been collected (full history would need another source).
+ISM_SERIES_ID = 'ISM_PMI'
 
-def fetch_retail_sales(label, lookback=120):
-    url = 'https://fred.stlouisfed.org/graph/fredgraph.csv?id=RSAFS'
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        df = pd.read_csv(io.StringIO(response.text))
-        df['Date'] = pd.to_datetime(df['observation_date'], errors='coerce')
-        df['Sales'] = pd.to_numeric(df['RSAFS'], errors='coerce')
-        df = df.dropna(subset=['Date', 'Sales'])
-        start_date = pd.Timestamp.now() - relativedelta(months=lookback + 1)
-        df = df[df['Date'] >= start_date].sort_values('Date')
-        df[label] = df['Sales'].pct_change() * 100
-        df = df.dropna()[['Date', label]]
+def download_ism_pmi(since):
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
+    response = http_get(ISM_URL, 'investing', headers=headers)
+    response.raise_for_status()
+    df = parse_ism_html(response.text).rename(columns={'ISM Manufacturing PMI': 'Value'})
+    if df.empty:
+        df = pd.DataFrame(columns=['Date', 'Value'])
+        df.attrs['covered_from'] = pd.Timestamp.max.normalize()
         return df
-    except Exception as e:
-        print(f'Fetch failed for {label}: {e}')
-        return pd.DataFrame()
+    covered_from = df['Date'].min()
+    df = df[df['Date'] >= since].reset_index(drop=True)
+    df.attrs['covered_from'] = covered_from
+    return df
 
-def fetch_housing_starts(label, lookback=120):
-    url = 'https://fred.stlouisfed.org/graph/fredgraph.csv?id=HOUST'
+def fetch_ism_pmi(lookback=120):
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        df = pd.read_csv(io.StringIO(response.text))
-        df['Date'] = pd.to_datetime(df['observation_date'], errors='coerce')
-        df['Value'] = pd.to_numeric(df['HOUST'], errors='coerce') / 1000
-        df = df.dropna(subset=['Date', 'Value'])
-        start_date = pd.Timestamp.now() - relativedelta(months=lookback)
-        df = df[df['Date'] >= start_date].sort_values('Date').tail(lookback)
-        df[label] = df['Value']
-        return df[['Date', label]]
+        data = sync_series(ISM_SERIES_ID, _lookback_start(lookback), download_ism_pmi, partial=True)
+        data = data.rename(columns={'Value': 'ISM Manufacturing PMI'})
+        data['ISM Manufacturing PMI'] = pd.to_numeric(data['ISM Manufacturing PMI'], errors='coerce')
+        return data[data['Date'] >= _lookback_start(lookback)].reset_index(drop=True)
     except Exception as e:
-        print(f'Fetch failed for {label}: {e}')
+        log_event('fetch_failed', logging.WARNING, indicator='ism', error=str(e))
         return pd.DataFrame()
 
-def fetch_durable_goods(label, lookback=120):
-    url = 'https://fred.stlouisfed.org/graph/fredgraph.csv?id=DGORDER'
+# Parsed FOMC table keyed by a hash of the page it came from, so an unchanged page (e.g. a 304 from
+# the HTTP cache) is never parsed again
+FOMC_TABLE_PATH = os.path.join(CACHE_DIR, 'fomc_table.json')
+_fomc_table_state = {}
+
+def download_fomc_rates(since):
+    response = http_get(FOMC_URL, 'wikipedia')
+    response.raise_for_status()
+    data = fomc_table(response.text)
+    return data[data['Date'] >= since]
+
+def fomc_table(text):
+    digest = hashlib.sha1(text.encode('utf-8', 'replace')).hexdigest()
+    if not _fomc_table_state:
+        try:
+            with open(FOMC_TABLE_PATH) as f:
+                _fomc_table_state.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+    if _fomc_table_state.get('sha1') == digest:
+        return pd.DataFrame({'Date': pd.to_datetime(_fomc_table_state['dates']), 'Value': _fomc_table_state['values']})
+    data = parse_fomc_html(text, pd.Timestamp.min)
+    _fomc_table_state.update({'sha1': digest, 'dates': data['Date'].dt.strftime('%Y-%m-%d').tolist(), 'values': data['Value'].tolist()})
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        df = pd.read_csv(io.StringIO(response.text))
-        df['Date'] = pd.to_datetime(df['observation_date'], errors='coerce')
-        df['Sales'] = pd.to_numeric(df['DGORDER'], errors='coerce')
-        df = df.dropna(subset=['Date', 'Sales'])
-        start_date = pd.Timestamp.now() - relativedelta(months=lookback + 1)
-        df = df[df['Date'] >= start_date].sort_values('Date')
-        df[label] = df['Sales'].pct_change() * 100
-        df = df.dropna()[['Date', label]]
-        return df
+        _write_atomic(FOMC_TABLE_PATH, lambda f: json.dump(_fomc_table_state, f), mode='w')
+    except OSError as e:
+        log_event('fomc_table_save_failed', logging.WARNING, error=str(e))
+    return data
+
+# Only the rate-history table is handed to read_html: tables are located by their header row first
+_HTML_TABLE_RE = re.compile(r'<table\b.*?</table>', re.S | re.I)
+
+def extract_fomc_table(text):
+    for match in _HTML_TABLE_RE.finditer(text):
+        table = match.group(0)
+        header = re.sub(r'\s+', ' ', re.sub(r'<[^>]+>', ' ', table[:table.lower().find('</tr>')]))
+        if 'Fed. Funds Rate' in header and 'Date' in header:
+            df = pd.read_html(io.StringIO(table))[0]
+            if 'Date' in df.columns and 'Fed. Funds Rate' in df.columns:
+                return df
+    # Fall back to a full-page parse if the markup defeats the header scan
+    for df in pd.read_html(io.StringIO(text)):
+        if 'Date' in df.columns and 'Fed. Funds Rate' in df.columns:
+            return df
+    raise ValueError('Expected columns not found in any table')
+
+# Normalized 'lower-upper' text and numeric (lower, upper); a single rate is both bounds, unparseable rows are NaN
+def split_rate_range(values):
+    text = values.astype(str).str.replace(r'\[.*?\]', '', regex=True).str.replace('%', '', regex=False)
+    parts = text.str.extract(r'(\d+(?:\.\d+)?)\s*(?:[-–—]\s*(\d+(?:\.\d+)?))?')
+    lower = pd.to_numeric(parts[0], errors='coerce')
+    upper = pd.to_numeric(parts[1], errors='coerce').fillna(lower)
+    return lower, upper
+
+def parse_fomc_html(text, since):
+    table = extract_fomc_table(text)
+    dates = pd.to_datetime(table['Date'].astype(str).str.replace(r'\[.*?\]', '', regex=True).str.strip(), errors='coerce')
+    lower, upper = split_rate_range(table['Fed. Funds Rate'])
+    data = pd.DataFrame({'Date': dates, 'Value': lower.map('{:.2f}'.format) + '-' + upper.map('{:.2f}'.format)})
+    data = data[dates.notna() & upper.notna()]
+    return data[data['Date'] >= since].reset_index(drop=True)
+
+def fetch_fomc_rates(lookback=120):
+    try:
+        start_date = pd.Timestamp.now() - relativedelta(months=lookback)
+        data = sync_series('FOMC_RATES', start_date, download_fomc_rates)
+        data = data.rename(columns={'Value': 'Rate Range %'})
+        data = data.sort_values('Date')
+        data = data[data['Date'] >= start_date]
+        return data
     except Exception as e:
-        print(f'Fetch failed for {label}: {e}')
+        log_event('fetch_failed', logging.WARNING, indicator='fomc', error=str(e))
         return pd.DataFrame()
 
 # Descriptions
@@ -185,13 +1000,14 @@ descriptions = {
     'pce': 'PCE (YoY %): Fed\'s preferred inflation measure of household spending prices. Rising YoY indicates eroding purchasing power.',
     'retail': 'Retail Sales (MoM %): Monthly change in retail spending. Increases reflect consumer confidence; key for GDP (70% from consumption).',
     'ppi': 'PPI (YoY %): Annual change in producers\' selling prices. Leads CPI; high values may pass costs to consumers, signaling inflation.',
-    'ism': 'ISM Manufacturing PMI: Survey-based index of manufacturing health. >50 = expansion, <50 = contraction; leading economic indicator. Note: Limited to last 6 months due to data fetch effort; historical data available but not justified for now.',
+    'ism': 'ISM Manufacturing PMI: Survey-based index of manufacturing health. >50 = expansion, <50 = contraction; leading economic indicator. Only recent prints are published on investing.com, so history builds up from the first sync as each new print is stored.',
     'conf': 'Consumer Confidence Index: Gauges optimism on economy/finances. High scores predict more spending; low suggest caution.',
     'housing': 'Housing Starts (Millions annualized): Annualized new home constructions started. High numbers show housing demand and economic confidence.',
     'trade': 'Trade Balance ($ Millions): Exports minus imports. Surplus positive; US often in deficit, impacting currency and growth.',
     'claims': 'Jobless Claims: Weekly new unemployment filings. Low/falling claims indicate healthy job market; spikes warn of slowdowns.',
     'durable': 'Durable Goods Orders (MoM %): Monthly change in orders for long-lasting goods. Rises signal business investment and expansion.',
     'prod': 'Productivity (QoQ Annualized %): Output per hour (nonfarm). Higher growth rates support growth without inflation; key for wages/profits.',
+    'corr': 'Indicator Correlations: Pairwise correlation of each indicator (as charted) over the latest window, on a common monthly calendar (weekly claims averaged, quarterly and FOMC values carried forward). Red = move together, blue = move opposite.',
     'fomc_3d': '3D FOMC Upper Rates: Visualizes upper fed funds rate (y-axis) over meeting dates (x-axis) with depth (z-axis) representing time sequence (higher z = more recent). Color gradient from blue (older) to red (recent) highlights trend evolution. Rotate to see rate changes in 3D perspective for better trend analysis.'
 }
 
@@ -233,45 +1049,640 @@ release_dates = {
     'Productivity': ['2025-08-07', '2025-09-04', '2025-11-06', '2025-12-09', '2026-02-06', '2026-03-06', '2026-05-07', '2026-06-05', '2026-08-06', '2026-09-04', '2026-11-05', '2026-12-09']
 }
 
-# Function to fetch data
-def get_data(lookback=120):
-    data_dict = {}
-    data_dict['nfp'] = fetch_fred_data('PAYEMS', 'NFP (thousands added)', lookback=lookback)
-    if not data_dict['nfp'].empty:
-        data_dict['nfp']['NFP (thousands added)'] = data_dict['nfp']['NFP (thousands added)'].diff().dropna()
-    data_dict['cpi'] = fetch_fred_data('CPIAUCSL', 'CPI (YoY %)', lookback=lookback, is_yoy=True)
-    data_dict['gdp'] = fetch_fred_data('A191RL1Q225SBEA', 'GDP (QoQ Annualized %)', lookback=lookback)
-    data_dict['fomc'] = fetch_fomc_rates(lookback=lookback)
-    if not data_dict['fomc'].empty:
-        def get_plot_value(rate):
+# Release calendar: release_dates parsed once into sorted date lists per metric, queried by binary search
+release_calendar = {metric: sorted(datetime.date.fromisoformat(d) for d in dates) for metric, dates in release_dates.items()}
+# Chart row per metric (most important at the top)
+release_rank = {metric: len(metrics_list) - i for i, metric in enumerate(metrics_list)}
+
+def is_release_day(metric, day):
+    dates = release_calendar.get(metric, [])
+    i = bisect_left(dates, day)
+    return i < len(dates) and dates[i] == day
+
+def next_release(metric, today=None):
+    dates = release_calendar.get(metric, [])
+    i = bisect_left(dates, today or datetime.date.today())
+    return dates[i] if i < len(dates) else None
+
+def days_until(metric, today=None):
+    today = today or datetime.date.today()
+    release = next_release(metric, today)
+    return (release - today).days if release else None
+
+# Next release of every metric, soonest first
+def upcoming_releases(today=None, limit=None):
+    today = today or datetime.date.today()
+    upcoming = [(next_release(metric, today), metric) for metric in metrics_list]
+    upcoming = sorted((item for item in upcoming if item[0]), key=lambda item: (item[0], -release_rank[item[1]]))
+    return upcoming[:limit] if limit else upcoming
+
+# Compact step function of the target range: one row per change (plus the latest decision, so the
+# step runs to the present). Shared by the 2D step chart and the 3D view.
+def fomc_step_series(df):
+    lower, upper = split_rate_range(df['Rate Range %'])
+    df = df.assign(**{'Lower Rate (%)': lower, 'Upper Rate (%)': upper}).dropna(subset=['Upper Rate (%)'])
+    df = df.sort_values('Date').reset_index(drop=True)
+    bounds = df[['Lower Rate (%)', 'Upper Rate (%)']]
+    changed = bounds.ne(bounds.shift()).any(axis=1)
+    changed.iloc[-1:] = True
+    return df[changed].reset_index(drop=True)
+
+def fetch_fomc_decisions(lookback=120):
+    df = fetch_fomc_rates(lookback=lookback)
+    return fomc_step_series(df) if not df.empty else df
+
+indicators = {
+    'nfp': {'source': 'fred', 'series': 'PAYEMS', 'label': 'NFP (thousands added)', 'transform': 'diff', 'freq': 'M', 'chart': 'bar'},
+    'cpi': {'source': 'fred', 'series': 'CPIAUCSL', 'label': 'CPI (YoY %)', 'transform': 'yoy', 'freq': 'M', 'chart': 'line'},
+    'gdp': {'source': 'fred', 'series': 'A191RL1Q225SBEA', 'label': 'GDP (QoQ Annualized %)', 'transform': None, 'freq': 'Q', 'chart': 'bar'},
+    'fomc': {'source': 'fomc', 'series': 'FOMC_RATES', 'label': 'Upper Rate (%)', 'transform': None, 'freq': None, 'chart': 'step',
+             'fetch': fetch_fomc_decisions},
+    'unemp': {'source': 'fred', 'series': 'UNRATE', 'label': 'Unemployment Rate (%)', 'transform': None, 'freq': 'M', 'chart': 'line'},
+    'pce': {'source': 'fred', 'series': 'PCEPI', 'label': 'PCE (YoY %)', 'transform': 'yoy', 'freq': 'M', 'chart': 'line'},
+    'retail': {'source': 'fred', 'series': 'RSAFS', 'label': 'Retail Sales (MoM %)', 'transform': 'mom', 'freq': 'M', 'chart': 'line'},
+    'ppi': {'source': 'fred', 'series': 'PPIACO', 'label': 'PPI (YoY %)', 'transform': 'yoy', 'freq': 'M', 'chart': 'line'},
+    'ism': {'source': 'ism', 'series': ISM_SERIES_ID, 'label': 'ISM Manufacturing PMI', 'transform': None, 'freq': 'M', 'chart': 'line',
+            'fetch': fetch_ism_pmi},
+    'conf': {'source': 'fred', 'series': 'UMCSENT', 'label': 'Consumer Confidence Index', 'transform': None, 'freq': 'M', 'chart': 'line'},
+    'housing': {'source': 'fred', 'series': 'HOUST', 'label': 'Housing Starts (Millions annualized)', 'transform': None, 'freq': 'M', 'chart': 'line',
+                'scale': 0.001},
+    'trade': {'source': 'fred', 'series': 'BOPGSTB', 'label': 'Trade Balance ($ Millions)', 'transform': None, 'freq': 'M', 'chart': 'trade'},
+    'claims': {'source': 'fred', 'series': 'ICSA', 'label': 'Jobless Claims', 'transform': None, 'freq': 'W', 'chart': 'line'},
+    'durable': {'source': 'fred', 'series': 'DGORDER', 'label': 'Durable Goods Orders (MoM %)', 'transform': 'mom', 'freq': 'M', 'chart': 'line'},
+    'prod': {'source': 'fred', 'series': 'PRS85006092', 'label': 'Productivity (QoQ Annualized %)', 'transform': None, 'freq': 'Q', 'chart': 'line'},
+}
+fred_codes = [spec['series'] for spec in indicators.values() if spec['source'] == 'fred']
+
+# Indicator fetch tasks in dashboard order: key -> callable(lookback)
+fetch_tasks = {key: spec.get('fetch') or functools.partial(fetch_fred_indicator, key) for key, spec in indicators.items()}
+
+# Last good frame per (key, lookback), served as stale when a fetch misses the deadline
+_last_good = {}
+_last_good_lock = threading.Lock()
+
+# Wait up to `timeout` seconds for one submitted fetch; returns (frame, status) where status is
+# 'ok', 'stale' (last good frame for this lookback) or 'unavailable'
+def _resolve_series(key, future, lookback, timeout):
+    timed_out = False
+    try:
+        df = future.result(timeout=max(timeout, 0))
+    except FuturesTimeout:
+        df = pd.DataFrame()
+        timed_out = True
+    except Exception:
+        df = pd.DataFrame()
+    if not df.empty:
+        with _last_good_lock:
+            _last_good[(key, lookback)] = df
+        inc_counter('dashboard_series_status_total', indicator=key, status='ok')
+        return df, 'ok'
+    with _last_good_lock:
+        stale = _last_good.get((key, lookback))
+    status = 'stale' if stale is not None else 'unavailable'
+    inc_counter('dashboard_series_status_total', indicator=key, status=status)
+    log_event('series_degraded', logging.WARNING, indicator=key, status=status, reason='timed out' if timed_out else 'no data')
+    return (stale if stale is not None else df), status
+
+# Run one fetch, recording its latency and empty results per indicator
+def timed_fetch(key, fetch, *args):
+    start = time.perf_counter()
+    result = fetch(*args)
+    observe('dashboard_fetch_seconds', time.perf_counter() - start, indicator=key)
+    if len(result) == 0:
+        inc_counter('dashboard_fetch_failures_total', indicator=key)
+    return result
+
+# The FRED batch and panel build is submitted first; FRED indicator tasks wait on it and take their column
+def submit_fetches(lookback=120):
+    panel = FETCH_POOL.submit(timed_fetch, 'fred_panel', sync_and_build_panel, fred_codes, lookback)
+    return {key: FETCH_POOL.submit(timed_fetch, key, fetch_fred_indicator, key, lookback, panel) if spec['source'] == 'fred'
+            else FETCH_POOL.submit(timed_fetch, key, fetch_tasks[key], lookback) for key, spec in indicators.items()}
+
+# Collect submitted fetches against a shared deadline timestamp.
+# Returns {key: DataFrame} plus per-series status under '_status'.
+def collect_frames(futures, lookback, deadline_at):
+    frames = {}
+    status = {}
+    for key, future in futures.items():
+        df, status[key] = _resolve_series(key, future, lookback, deadline_at - time.time())
+        if not df.empty:
+            frames[key] = df
+    frames['_status'] = status
+    return frames
+
+# Runs every fetch task concurrently and waits at most `deadline` seconds in total
+def get_frames(lookback=120, deadline=None):
+    deadline = FETCH_DEADLINE_SECONDS if deadline is None else deadline
+    return collect_frames(submit_fetches(lookback), lookback, time.time() + deadline)
+
+# Server-side data cache: version token -> {key: DataFrame}. The data-store only carries
+# {'version': ..., 'lookback': ...}; callbacks resolve it with load_data.
+DATA_CACHE_SIZE = 8
+_data_cache = OrderedDict()
+_data_cache_lock = threading.Lock()
+
+# Content hash per series, so refreshes that return identical data keep the same versions
+def series_versions(frames):
+    return {key: hashlib.sha1(pd.util.hash_pandas_object(df, index=False).values.tobytes()).hexdigest()[:16]
+            for key, df in frames.items() if not key.startswith('_')}
+
+def data_version(frames):
+    versions = frames.get('_versions') or series_versions(frames)
+    return hashlib.sha1(json.dumps(versions, sort_keys=True).encode()).hexdigest()[:16]
+
+def _cache_store(version, frames):
+    if '_versions' not in frames:
+        frames['_versions'] = series_versions(frames)
+    with _data_cache_lock:
+        _data_cache[version] = frames
+        _data_cache.move_to_end(version)
+        while len(_data_cache) > DATA_CACHE_SIZE:
+            _data_cache.popitem(last=False)
+
+def cache_put(frames, lookback):
+    version = data_version(frames)
+    _cache_store(version, frames)
+    return {'version': version, 'lookback': lookback}
+
+# Cross-process frames cache: every built frame set is pickled under CACHE_DIR/shared by version, so a
+# token minted by one worker resolves in any other, and latest-<lookback>.json points at the newest
+# build per window. Builds go through shared_frames, which collapses concurrent identical refreshes
+# across workers into one: late arrivals wait on the build lock and reuse the leader's result.
+SHARED_DIR = os.path.join(CACHE_DIR, 'shared')
+SHARED_CACHE_SIZE = 32
+# A published build younger than this is reused instead of refetching
+SHARED_MAX_AGE_SECONDS = int(os.environ.get('DASHBOARD_SHARED_MAX_AGE_SECONDS', 60))
+
+def shared_put(version, frames):
+    if '_versions' not in frames:
+        frames['_versions'] = series_versions(frames)
+    _write_atomic(os.path.join(SHARED_DIR, f'frames-{version}.pkl'), lambda f: pickle.dump(frames, f, protocol=pickle.HIGHEST_PROTOCOL))
+    mtimes = {}
+    for name in os.listdir(SHARED_DIR):
+        if name.endswith('.pkl'):
             try:
-                rate = rate.strip()
-                if '-' in rate:
-                    return float(rate.split('-')[1])
-                return float(rate)
-            except:
-                return 0.0
-        data_dict['fomc']['Upper Rate (%)'] = data_dict['fomc']['Rate Range %'].apply(get_plot_value)
-    data_dict['unemp'] = fetch_fred_data('UNRATE', 'Unemployment Rate (%)', lookback=lookback)
-    data_dict['pce'] = fetch_fred_data('PCEPI', 'PCE (YoY %)', lookback=lookback, is_yoy=True)
-    data_dict['retail'] = fetch_retail_sales('Retail Sales (MoM %)', lookback=lookback)
-    data_dict['ppi'] = fetch_fred_data('PPIACO', 'PPI (YoY %)', lookback=lookback, is_yoy=True)
-    data_dict['ism'] = fetch_ism_pmi(lookback=6)
-    data_dict['conf'] = fetch_fred_data('UMCSENT', 'Consumer Confidence Index', lookback=lookback)
-    data_dict['housing'] = fetch_housing_starts('Housing Starts (Millions annualized)', lookback=lookback)
-    data_dict['trade'] = fetch_fred_data('BOPGSTB', 'Trade Balance ($ Millions)', lookback=lookback)
-    data_dict['claims'] = fetch_fred_data('ICSA', 'Jobless Claims', lookback=lookback)
-    data_dict['durable'] = fetch_durable_goods('Durable Goods Orders (MoM %)', lookback=lookback)
-    data_dict['prod'] = fetch_fred_data('PRS85006092', 'Productivity (QoQ Annualized %)', lookback=lookback)
-    return {k: v.to_dict('records') for k, v in data_dict.items() if not v.empty}
-
-# Initial serialized data
-initial_serialized_data = get_data(120)
+                mtimes[name] = os.path.getmtime(os.path.join(SHARED_DIR, name))
+            except OSError:
+                pass
+    for name in sorted(mtimes, key=mtimes.get)[:-SHARED_CACHE_SIZE]:
+        try:
+            os.remove(os.path.join(SHARED_DIR, name))
+        except OSError:
+            pass
+
+def shared_get(version):
+    path = os.path.join(SHARED_DIR, f'frames-{version}.pkl')
+    try:
+        with open(path, 'rb') as f:
+            frames = pickle.load(f)
+        os.utime(path)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        count_cache('shared', False)
+        return None
+    count_cache('shared', True)
+    return frames
+
+def shared_latest(lookback):
+    try:
+        with open(os.path.join(SHARED_DIR, f'latest-{lookback}.json')) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def shared_publish(version, frames, lookback, fetched_at):
+    shared_put(version, frames)
+    with shared_lock(f'publish-{lookback}'):
+        latest = shared_latest(lookback)
+        if latest is None or latest['fetched_at'] <= fetched_at:
+            _write_atomic(os.path.join(SHARED_DIR, f'latest-{lookback}.json'),
+                          lambda f: json.dump({'version': version, 'fetched_at': fetched_at}, f), mode='w')
+
+# Single-flight build for a window: returns (version, frames)
+def shared_frames(lookback=120, deadline=None, max_age=SHARED_MAX_AGE_SECONDS):
+    requested = time.time()
+
+    def reusable(latest):
+        # Fresh enough, or finished by another worker while this one waited on the lock
+        return latest is not None and (requested - latest['fetched_at'] < max_age or latest['fetched_at'] >= requested)
+
+    latest = shared_latest(lookback)
+    if not reusable(latest):
+        with shared_lock(f'build-{lookback}'):
+            latest = shared_latest(lookback)
+            if not reusable(latest):
+                frames = get_frames(lookback, deadline)
+                frames['_versions'] = series_versions(frames)
+                version = data_version(frames)
+                try:
+                    shared_publish(version, frames, lookback, time.time())
+                except OSError as e:
+                    log_event('shared_cache_write_failed', logging.WARNING, error=str(e))
+                return version, frames
+    frames = shared_get(latest['version'])
+    if frames is None:
+        frames = get_frames(lookback, deadline)
+        return data_version(frames), frames
+    return latest['version'], frames
+
+# In-flight fetches started from the UI: job version -> (futures, lookback, deadline timestamp).
+# Charts resolve their own series from the job as soon as it lands, without waiting for the rest.
+FETCH_JOBS_SIZE = 8
+_fetch_jobs = OrderedDict()
+
+def start_fetch(lookback=120):
+    # A build just published by any worker is served as is
+    latest = shared_latest(lookback)
+    if latest is not None and time.time() - latest['fetched_at'] < SHARED_MAX_AGE_SECONDS:
+        return {'version': latest['version'], 'lookback': lookback}
+    with _data_cache_lock:
+        # Join a job for the same window that is still in flight in this worker
+        for version, (futures, job_lookback, _, _) in reversed(_fetch_jobs.items()):
+            if job_lookback == lookback and not all(future.done() for future in futures.values()):
+                return {'version': version, 'lookback': lookback}
+    version = 'job-' + uuid.uuid4().hex[:12]
+    job = (submit_fetches(lookback), lookback, time.time() + FETCH_DEADLINE_SECONDS, time.time())
+    with _data_cache_lock:
+        _fetch_jobs[version] = job
+        while len(_fetch_jobs) > FETCH_JOBS_SIZE:
+            _fetch_jobs.popitem(last=False)
+    return {'version': version, 'lookback': lookback}
+
+# Resolve a data-store token to frames; evicted or foreign tokens are rebuilt from the local series store
+def load_data(token):
+    if not token:
+        return {'_status': {}}
+    with _data_cache_lock:
+        frames = _data_cache.get(token['version'])
+        if frames is not None:
+            _data_cache.move_to_end(token['version'])
+            count_cache('data', True)
+            return frames
+        job = _fetch_jobs.get(token['version'])
+    count_cache('data', False)
+    if job is not None:
+        frames = collect_frames(*job[:3])
+        try:
+            shared_publish(token['version'], frames, token['lookback'], job[3])
+        except OSError as e:
+            log_event('shared_cache_write_failed', logging.WARNING, error=str(e))
+    else:
+        # Minted by another worker: read its build, and only refetch when it has been evicted
+        frames = shared_get(token['version'])
+        if frames is None:
+            frames = shared_frames(token['lookback'])[1]
+    _cache_store(token['version'], frames)
+    return frames
+
+# Resolve a single series and its status ('ok', 'stale' or 'unavailable') from a token, waiting only on
+# that series when it is still being fetched
+def load_series_status(token, key):
+    with _data_cache_lock:
+        job = _fetch_jobs.get(token['version']) if token else None
+    if job is not None:
+        futures, lookback, deadline_at, _ = job
+        return _resolve_series(key, futures[key], lookback, deadline_at - time.time())
+    frames = load_data(token)
+    return frames.get(key, pd.DataFrame()), frames.get('_status', {}).get(key, 'ok')
+
+def load_series(token, key):
+    return load_series_status(token, key)[0]
+
+# Function to fetch data: returns the data-store token for a fresh fetch
+def get_data(lookback=120, deadline=None):
+    version, frames = shared_frames(lookback, deadline)
+    _cache_store(version, frames)
+    return {'version': version, 'lookback': lookback}
+
+# Snapshot of the last warmed data, so the app can boot without waiting on upstream sources
+SNAPSHOT_PATH = os.path.join(CACHE_DIR, 'snapshot.json')
+# 'background' boots from the snapshot (or an empty placeholder) and warms in a thread; 'blocking' fetches at import;
+# 'off' does neither, for report runs and their workers, which build or receive their own data
+REPORT_RUN_ENV = {'DASHBOARD_STARTUP_MODE': 'off', 'DASHBOARD_REFRESH_SCHEDULER': '0'}
+if __name__ == '__main__' and '--report' in sys.argv[1:]:
+    os.environ.update(REPORT_RUN_ENV)
+STARTUP_MODE = os.environ.get('DASHBOARD_STARTUP_MODE', 'background')
+
+# Typed arrays and epoch-millisecond dates, shared by the snapshot format and the figure wire format
+# (see compact_figure)
+def typed_array(values):
+    values = np.asarray(values)
+    if values.dtype.kind in 'iub' and len(values) and np.iinfo(np.int32).min <= values.min() and values.max() <= np.iinfo(np.int32).max:
+        values, dtype = values.astype('<i4'), 'i4'
+    else:
+        values, dtype = values.astype('<f8'), 'f8'
+    encoded = {'dtype': dtype, 'bdata': base64.b64encode(np.ascontiguousarray(values).tobytes()).decode('ascii')}
+    if values.ndim > 1:
+        encoded['shape'] = ','.join(str(n) for n in values.shape)
+    return encoded
+
+# Epoch milliseconds for a date array, or None when the values are not dates
+def epoch_ms(values):
+    values = np.asarray(values)
+    if values.dtype.kind != 'M':
+        if values.dtype.kind != 'O' or not len(values) or not isinstance(values[0], (datetime.date, pd.Timestamp)):
+            return None
+        values = pd.to_datetime(values).values
+    return values.astype('datetime64[ms]').astype('int64').astype(float)
+
+# {column: values} with dates as epoch milliseconds, in place of per-row records
+def columnar(df):
+    columns = {}
+    for column in df.columns:
+        dates = epoch_ms(df[column].to_numpy()) if column == 'Date' else None
+        columns[column] = dates.astype('int64').tolist() if dates is not None else df[column].tolist()
+    return columns
+
+def load_snapshot():
+    try:
+        with open(SNAPSHOT_PATH) as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return {'_status': {}}
+    frames = {'_status': snapshot.pop('_status', {})}
+    for key, columns in snapshot.items():
+        if key.startswith('_'):
+            continue
+        # Columnar with epoch-millisecond dates; snapshots written before that hold row records
+        df = pd.DataFrame(columns)
+        df['Date'] = pd.to_datetime(df['Date'], unit='ms') if pd.api.types.is_numeric_dtype(df['Date']) else pd.to_datetime(df['Date'])
+        frames[key] = df
+    return frames
+
+def save_snapshot(frames):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    snapshot = {k: v if k.startswith('_') else columnar(v) for k, v in frames.items()}
+    _write_atomic(SNAPSHOT_PATH, lambda f: json.dump(snapshot, f, default=str), mode='w')
+
+_warm_state = {'token': None}
+_warm_ready = threading.Event()
+
+WARM_RETRY_SECONDS = 30
+WARM_RETRY_MAX_SECONDS = 600
+
+# Returns whether the warm succeeded; a failure is logged and leaves the previous token in place
+def warm_data(lookback=120, max_age=SHARED_MAX_AGE_SECONDS):
+    try:
+        version, frames = shared_frames(lookback, max_age=max_age)
+        try:
+            save_snapshot(frames)
+        except OSError as e:
+            log_event('snapshot_save_failed', logging.WARNING, error=str(e))
+        _cache_store(version, frames)
+    except Exception as e:
+        log_event('warm_failed', logging.ERROR, lookback=lookback, error=repr(e))
+        return False
+    _warm_state['token'] = {'version': version, 'lookback': lookback}
+    _warm_ready.set()
+    return True
+
+# Startup warm in the background, retried with backoff so clients are not left polling a dead warmer
+def _warm_until_ready(lookback):
+    delay = WARM_RETRY_SECONDS
+    while not warm_data(lookback):
+        time.sleep(delay)
+        delay = min(delay * 2, WARM_RETRY_MAX_SECONDS)
+
+# Pick up a newer full-window build published by another worker (e.g. after the scheduler leader's refresh)
+def adopt_shared_warm(lookback=120):
+    latest = shared_latest(lookback)
+    token = _warm_state['token']
+    if latest is None or (token is not None and latest['version'] == token['version']):
+        return
+    frames = shared_get(latest['version'])
+    if frames is not None:
+        _cache_store(latest['version'], frames)
+        _warm_state['token'] = {'version': latest['version'], 'lookback': lookback}
+        _warm_ready.set()
+
+def start_warmer(lookback=120):
+    threading.Thread(target=_warm_until_ready, args=(lookback,), name='data-warmer', daemon=True).start()
+
+# Freshest full-window token available without fetching
+def current_data():
+    adopt_shared_warm()
+    return _warm_state['token'] if _warm_ready.is_set() else initial_data_token
+
+# Initial data token
+if STARTUP_MODE == 'blocking':
+    initial_data_token = _warm_state['token'] if warm_data(120) else cache_put(load_snapshot(), 120)
+elif STARTUP_MODE == 'off':
+    initial_data_token = cache_put({'_status': {}}, 120)
+else:
+    initial_data_token = cache_put(load_snapshot(), 120)
+    start_warmer(120)
+
+# Release-calendar refresh scheduler: on a release day, after the release time, only the due
+# series are refreshed, polling upstream with backoff until the new print shows up.
+REFRESH_SCHEDULER = os.environ.get('DASHBOARD_REFRESH_SCHEDULER', '1') == '1'
+RELEASE_TIMEZONE = ZoneInfo(os.environ.get('DASHBOARD_RELEASE_TZ', 'America/New_York'))
+DEFAULT_RELEASE_TIME = os.environ.get('DASHBOARD_RELEASE_TIME', '08:30')
+release_times = {
+    'FOMC Decisions': '14:00',
+    'ISM Manufacturing PMI': '10:00',
+    'Consumer Confidence Index': '10:00',
+}
+# Metric -> indicator key
+release_series = {
+    'Nonfarm Payrolls (NFP)': 'nfp',
+    'Consumer Price Index (CPI)': 'cpi',
+    'Gross Domestic Product (GDP)': 'gdp',
+    'FOMC Decisions': 'fomc',
+    'Unemployment Rate': 'unemp',
+    'Personal Consumption Expenditures (PCE)': 'pce',
+    'Retail Sales': 'retail',
+    'Producer Price Index (PPI)': 'ppi',
+    'ISM Manufacturing PMI': 'ism',
+    'Consumer Confidence Index': 'conf',
+    'Housing Starts': 'housing',
+    'Trade Balance': 'trade',
+    'Jobless Claims': 'claims',
+    'Durable Goods Orders': 'durable',
+    'Productivity': 'prod',
+}
+SCHEDULER_TICK_SECONDS = 60
+RELEASE_POLL_INITIAL_SECONDS = 120
+RELEASE_POLL_MAX_SECONDS = 1800
+RELEASE_POLL_ATTEMPTS = 10
+
+def due_releases(now):
+    return [metric for metric in release_dates
+            if is_release_day(metric, now.date()) and now.strftime('%H:%M') >= release_times.get(metric, DEFAULT_RELEASE_TIME)]
+
+# Recent stored rows, so revisions to the latest observation count as a new print too
+def _series_fingerprint(series_id):
+    return store_read(series_id).tail(3).to_json()
+
+def refresh_release(metric):
+    task_key = release_series[metric]
+    series_ids = [indicators[task_key]['series']] if indicators[task_key]['series'] else []
+    before = {series_id: _series_fingerprint(series_id) for series_id in series_ids}
+    delay = RELEASE_POLL_INITIAL_SECONDS
+    for attempt in range(RELEASE_POLL_ATTEMPTS):
+        for series_id in series_ids:
+            store_expire(series_id)
+        fetch_tasks[task_key](120)
+        if not series_ids or any(_series_fingerprint(series_id) != before[series_id] for series_id in series_ids):
+            log_event('release_refreshed', metric=metric, attempts=attempt + 1)
+            _set_release_missed(series_ids, False)
+            warm_data(120, max_age=0)
+            return True
+        time.sleep(delay)
+        delay = min(delay * 2, RELEASE_POLL_MAX_SECONDS)
+    log_event('release_refresh_gave_up', logging.WARNING, metric=metric, attempts=RELEASE_POLL_ATTEMPTS)
+    _set_release_missed(series_ids, True)
+    return False
+
+def run_release_scheduler():
+    # One worker drives release refreshes; the others adopt its builds through the shared cache
+    # and take over when it exits
+    leader = try_process_lock('release-scheduler')
+    while not leader:
+        time.sleep(SCHEDULER_TICK_SECONDS)
+        leader = try_process_lock('release-scheduler')
+    handled = set()
+    while True:
+        now = datetime.datetime.now(RELEASE_TIMEZONE)
+        for metric in due_releases(now):
+            if (metric, now.date()) not in handled:
+                handled.add((metric, now.date()))
+                threading.Thread(target=refresh_release, args=(metric,), name=f'release-{release_series[metric]}', daemon=True).start()
+        time.sleep(SCHEDULER_TICK_SECONDS)
+
+def start_release_scheduler():
+    releases = {}
+    for metric, key in release_series.items():
+        if indicators[key]['series']:
+            releases.setdefault(indicators[key]['series'], set()).update(release_calendar.get(metric, []))
+    scheduled_series.update({series_id: sorted(dates) for series_id, dates in releases.items()})
+    threading.Thread(target=run_release_scheduler, name='release-scheduler', daemon=True).start()
+
+if REFRESH_SCHEDULER:
+    start_release_scheduler()
+
+# Cross-series analytics: indicator values as displayed, aligned to month starts (weekly averaged,
+# quarterly and FOMC carried forward), and a rolling correlation matrix over the latest window.
+# When only some series change and no new month appears, only their rows/columns are recomputed.
+CORRELATION_WINDOW = 36
+_correlation_state = {}
+_correlation_lock = threading.Lock()
+
+def align_monthly(df, key):
+    spec = indicators[key]
+    values = pd.to_numeric(df.set_index('Date')[spec['label']], errors='coerce')
+    if spec['freq'] == 'W':
+        return values.resample('MS').mean()
+    monthly = values.resample('MS').last()
+    return monthly.ffill(limit=2) if spec['freq'] == 'Q' else monthly
+
+def _join_aligned(columns, keys, base=None):
+    aligned = pd.concat(columns, axis=1) if base is None else base.join(pd.concat(columns, axis=1), how='outer')
+    aligned = aligned[keys]
+    step_keys = [k for k in keys if indicators[k]['freq'] is None]
+    aligned[step_keys] = aligned[step_keys].ffill()
+    return aligned
+
+def correlation_matrix(frames, lookback, window=CORRELATION_WINDOW):
+    versions = frames.get('_versions') or series_versions(frames)
+    keys = [k for k in indicators if k in frames and not frames[k].empty]
+    with _correlation_lock:
+        state = _correlation_state.get(lookback)
+    changed = [k for k in keys if state is None or versions.get(k) != state['versions'].get(k)]
+    if state is not None and not changed and list(state['aligned'].columns) == keys and state['window'] == window:
+        return state['corr']
+    if state is None or list(state['aligned'].columns) != keys or state['window'] != window:
+        aligned = _join_aligned({k: align_monthly(frames[k], k) for k in keys}, keys)
+        corr = aligned.tail(window).corr()
+    else:
+        aligned = _join_aligned({k: align_monthly(frames[k], k) for k in changed}, keys, base=state['aligned'].drop(columns=changed))
+        if not aligned.index.equals(state['aligned'].index):
+            # A new month shifts every pair's window
+            corr = aligned.tail(window).corr()
+        else:
+            corr = state['corr'].copy()
+            recent = aligned.tail(window)
+            for k in changed:
+                column = recent.corrwith(recent[k])
+                corr.loc[k, :] = column
+                corr.loc[:, k] = column
+    with _correlation_lock:
+        _correlation_state[lookback] = {'versions': dict(versions), 'aligned': aligned, 'corr': corr, 'window': window}
+    return corr
+
+def create_correlation_figure(corr, window=CORRELATION_WINDOW, theme='dark'):
+    template = 'plotly_dark' if theme == 'dark' else 'plotly'
+    labels = [indicators[k]['label'] for k in corr.columns]
+    fig = go.Figure(data=[go.Heatmap(
+        z=corr.values, x=labels, y=labels, zmin=-1, zmax=1, colorscale='RdBu',
+        text=corr.round(2).values, texttemplate='%{text}'
+    )])
+    fig.update_layout(title=f'Rolling {window}-month correlations', template=template, height=700, margin={'l':20, 'r':20, 't':50, 'b':20})
+    return fig
+
+# Large-series mode: past LARGE_SERIES_POINTS points a 2D chart is downsampled to PIXEL_BUDGET points
+# (LTTB for lines, per-bucket min/max for bars) and lines are drawn with WebGL (Scattergl).
+# Zooming a downsampled chart re-renders the visible range from the full-resolution frame (see zoom_figure);
+# other charts zoom in the browser only.
+LARGE_SERIES_POINTS = 1000
+PIXEL_BUDGET = 800
+
+# Largest-Triangle-Three-Buckets: indices of n_out points that keep the visual shape of (x, y)
+def lttb_indices(x, y, n_out):
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    every = (n - 2) / (n_out - 2)
+    picked = np.empty(n_out, dtype=int)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        picked[i + 1] = a
+    return picked
+
+# Min and max of each of n_out / 2 equal buckets, so spikes survive downsampling
+def minmax_indices(y, n_out):
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+    edges = np.linspace(0, n, n_out // 2 + 1).astype(int)
+    picked = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end > start:
+            picked.extend((start + int(y[start:end].argmin()), start + int(y[start:end].argmax())))
+    return np.unique(picked)
+
+def downsample_frame(df, x, y, n_out=PIXEL_BUDGET, is_bar=False):
+    df = df.dropna(subset=[x, y]).sort_values(x)
+    values = df[y].to_numpy(dtype=float)
+    if is_bar:
+        return df.iloc[minmax_indices(values, n_out)]
+    return df.iloc[lttb_indices(df[x].to_numpy().astype('datetime64[s]').astype(float), values, n_out)]
+
+# Visible x range from a graph's relayoutData: (start, end), 'auto' after a reset, or None
+def visible_range(relayout):
+    relayout = relayout or {}
+    if 'xaxis.range[0]' in relayout:
+        return relayout['xaxis.range[0]'], relayout['xaxis.range[1]']
+    if 'xaxis.range' in relayout:
+        return tuple(relayout['xaxis.range'])
+    if relayout.get('xaxis.autorange'):
+        return 'auto'
+    return None
 
 # Function to create compact figure
-def create_figure(serialized_df, x, y, title, is_bar=False, is_3d=False, is_trade=False, theme='dark'):
+def create_figure(df, x, y, title, is_bar=False, is_3d=False, is_trade=False, theme='dark', x_range=None, is_step=False, overlay=None):
     template = 'plotly_dark' if theme == 'dark' else 'plotly'
-    df = pd.DataFrame(serialized_df)
+    if not df.empty and not is_3d and x_range:
+        df = df[(df[x] >= pd.Timestamp(x_range[0])) & (df[x] <= pd.Timestamp(x_range[1]))]
+    large = len(df) > LARGE_SERIES_POINTS and not is_3d
+    if large:
+        df = downsample_frame(df, x, y, is_bar=is_bar)
     if df.empty:
         fig = px.line(title=title + ' (No Data)')
     elif is_3d:
@@ -286,26 +1697,140 @@ def create_figure(serialized_df, x, y, title, is_bar=False, is_3d=False, is_trad
         if is_bar:
             fig = px.bar(df, x=x, y=y, title=title)
         else:
-            fig = px.line(df, x=x, y=y, title=title, markers=True)
+            fig = px.line(df, x=x, y=y, title=title, markers=not large, render_mode='webgl' if large else 'auto',
+                          line_shape='hv' if is_step else 'linear')
         fig.update_layout(template=template, height=300, margin={'l':20, 'r':20, 't':50, 'b':20})
         fig.update_xaxes(title_text='', tickformat='%b %Y', nticks=12, tickangle=0)
+        if x_range:
+            fig.update_xaxes(range=list(x_range))
         if is_trade:
             ymin = min(df[y].min() * 1.1, 0)
             ymax = max(df[y].max() * 1.1, 0)
             fig.update_yaxes(range=[ymin, ymax])
+        # Extra (Date, value) series drawn over the chart, e.g. first prints from the vintage store
+        if overlay is not None and not overlay.empty:
+            fig.add_scatter(x=overlay['Date'], y=overlay.iloc[:, 1], name=overlay.columns[1], mode='lines+markers',
+                            line={'dash': 'dot'}, marker={'size': 5})
+            fig.data[0].name = y
+            fig.data[0].showlegend = True
+            fig.update_layout(legend={'orientation': 'h', 'y': 1.12, 'x': 0})
+    return fig
+
+# Memoized figures: LRU keyed by (series key, series version, lookback, chart kind, theme)
+FIGURE_CACHE_SIZE = 128
+_figure_cache = OrderedDict()
+_figure_cache_lock = threading.Lock()
+figure_cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+def memoized_figure(cache_key, build):
+    with _figure_cache_lock:
+        fig = _figure_cache.get(cache_key)
+        if fig is not None:
+            _figure_cache.move_to_end(cache_key)
+            figure_cache_stats['hits'] += 1
+            count_cache('figure', True)
+            return fig
+        figure_cache_stats['misses'] += 1
+    count_cache('figure', False)
+    fig = build()
+    with _figure_cache_lock:
+        _figure_cache[cache_key] = fig
+        while len(_figure_cache) > FIGURE_CACHE_SIZE:
+            _figure_cache.popitem(last=False)
+            figure_cache_stats['evictions'] += 1
     return fig
 
-# Function to create release dates figure (updated with vertical line for today's date)
-def create_release_figure(theme='dark'):
+def cached_figure(df, key, lookback, x, y, title, is_bar=False, is_3d=False, is_trade=False, theme='dark', is_step=False, overlay=None):
+    version = series_versions({key: df})[key]
+    overlay_version = series_versions({'overlay': overlay})['overlay'] if overlay is not None else None
+    cache_key = (key, version, lookback, y, title, is_bar, is_3d, is_trade, theme, is_step, overlay_version)
+    return memoized_figure(cache_key, lambda: create_figure(df, x, y, title, is_bar=is_bar, is_3d=is_3d, is_trade=is_trade, theme=theme,
+                                                            is_step=is_step, overlay=overlay))
+
+# Wire format for figures sent to the browser: x/y/z data as Plotly typed arrays ({'dtype', 'bdata'} with
+# base64 little-endian bytes) instead of JSON lists, with dates as epoch milliseconds on a date axis.
+# 'json' sends figures as plotly.py serializes them.
+WIRE_FORMAT = os.environ.get('DASHBOARD_WIRE_FORMAT', 'typed')
+# Share of figure responses whose size is measured in both encodings (each costs two extra serializations)
+PAYLOAD_SAMPLE_RATE = float(os.environ.get('DASHBOARD_PAYLOAD_SAMPLE_RATE', 0.01))
+
+# Numeric array (any shape) or None when the values are text
+def numeric_values(values):
+    values = np.asarray(values)
+    if values.dtype.kind in 'iubf':
+        return values
+    try:
+        return values.astype(float)
+    except (TypeError, ValueError):
+        return None
+
+def compact_figure(fig):
+    payload = fig.to_plotly_json()
+    date_axes = set()
+    for trace in payload['data']:
+        for axis in ('x', 'y', 'z'):
+            values = trace.get(axis)
+            if values is None or isinstance(values, (dict, str)) or not len(values):
+                continue
+            dates = epoch_ms(values) if axis != 'z' and trace.get('type') != 'scatter3d' else None
+            if dates is not None:
+                trace[axis] = typed_array(dates)
+                # Trace axis refs are 'x', 'x2', ...; the layout keys are 'xaxis', 'xaxis2', ...
+                date_axes.add(axis + 'axis' + trace.get(axis + 'axis', axis)[1:])
+                continue
+            numbers = numeric_values(values)
+            if numbers is not None:
+                trace[axis] = typed_array(numbers)
+    for name in date_axes:
+        payload['layout'].setdefault(name, {})['type'] = 'date'
+    return payload
+
+def wire_figure(fig, chart):
+    payload = compact_figure(fig) if WIRE_FORMAT == 'typed' else fig
+    if random.random() < PAYLOAD_SAMPLE_RATE:
+        for encoding, size in payload_sizes(fig, payload if WIRE_FORMAT == 'typed' else None).items():
+            observe('dashboard_figure_payload_bytes', size, SIZE_BUCKETS, chart=chart, encoding=encoding)
+    return payload
+
+# Serialized bytes of a figure as plain JSON and in the typed-array wire format (compacted here unless given)
+def payload_sizes(fig, compact=None):
+    compact = compact_figure(fig) if compact is None else compact
+    return {'json': len(fig.to_json()), 'typed': len(json.dumps(compact, cls=PlotlyJSONEncoder))}
+
+# Note drawn on charts whose series did not come back fresh (see collect_frames' '_status')
+status_notes = {
+    'stale': 'Stale: upstream unavailable, showing the last good data',
+    'unavailable': 'Unavailable: upstream failed and no data is stored',
+}
+
+def mark_status(fig, status):
+    if status not in status_notes:
+        return fig
+    fig = go.Figure(fig)
+    fig.add_annotation(text=status_notes[status], showarrow=False, xref='paper', yref='paper', x=1, y=1, xanchor='right', yanchor='bottom',
+                       font={'size': 11, 'color': '#e0a800'})
+    return fig
+
+# Empty figure shown while a chart's series is still loading
+def placeholder_figure(height=300, theme='dark'):
     template = 'plotly_dark' if theme == 'dark' else 'plotly'
     fig = go.Figure()
+    fig.update_layout(template=template, height=height, margin={'l':20, 'r':20, 't':50, 'b':20},
+                      xaxis={'visible': False}, yaxis={'visible': False},
+                      annotations=[{'text': 'Loading...', 'showarrow': False, 'xref': 'paper', 'yref': 'paper', 'x': 0.5, 'y': 0.5}])
+    return fig
+
+# Function to create release dates figure (vertical line at today's date)
+def create_release_figure(theme='dark', today=None):
+    template = 'plotly_dark' if theme == 'dark' else 'plotly'
+    today = today or datetime.date.today()
+    fig = go.Figure()
     colors = px.colors.sequential.RdBu  # Red to blue gradient
-    for i, metric in enumerate(metrics_list):
-        dates = release_dates.get(metric, [])
-        y_val = 16 - (i + 1)
-        normalize = (y_val - 1) / 15
-        color_index = int(normalize * (len(colors) - 1))
-        color = colors[color_index]
+    count = len(metrics_list)
+    for metric in metrics_list:
+        dates = release_calendar.get(metric, [])
+        y_val = release_rank[metric]
+        color = colors[int((y_val - 1) / count * (len(colors) - 1))]
         fig.add_trace(go.Scatter(
             x=dates,
             y=[y_val] * len(dates),
@@ -313,27 +1838,27 @@ def create_release_figure(theme='dark'):
             name=metric,
             marker=dict(color=color, size=10, symbol='circle')
         ))
-    # Add vertical line for today's date (August 03, 2025)
     fig.add_shape(
         type="line",
-        x0="2025-08-03", y0=0, x1="2025-08-03", y1=16,
+        x0=today, y0=0, x1=today, y1=count + 1,
         line=dict(color="Yellow", width=2, dash="dash"),
     )
     fig.add_annotation(
-        x="2025-08-03", y=16,
-        text="Today (Aug 03, 2025)",
+        x=today, y=count + 1,
+        text=f"Today ({today.strftime('%b %d, %Y')})",
         showarrow=True,
         arrowhead=1,
         yshift=10
     )
+    all_dates = [d for dates in release_calendar.values() for d in dates]
     fig.update_layout(
-        title='Upcoming Economic Release Dates (Aug 2025 - Dec 2026)',
+        title=f"Upcoming Economic Release Dates ({min(all_dates).strftime('%b %Y')} - {max(all_dates).strftime('%b %Y')})",
         xaxis=dict(title='Date', type='date'),
         yaxis=dict(
             title='Metrics (Ranked by Importance)',
-            tickvals=list(range(1, 16)),
+            tickvals=list(range(1, count + 1)),
             ticktext=metrics_list[::-1],  # Reverse so top is important
-            range=[0, 16]
+            range=[0, count + 1]
         ),
         template=template,
         height=600,
@@ -341,16 +1866,205 @@ def create_release_figure(theme='dark'):
     )
     return fig
 
-# Function to create release DF for download
+# Function to create release DF for download: one row per release date, one column per metric
+# holding the metric's chart rank on its release days (release_dates is static, so it is built once)
+@functools.lru_cache(maxsize=1)
 def create_release_df():
-    all_dates = sorted(set(date for dates in release_dates.values() for date in dates))
-    df = pd.DataFrame(index=pd.to_datetime(all_dates), columns=metrics_list)
-    for i, metric in enumerate(metrics_list):
-        y_val = 16 - (i + 1)
-        for date in release_dates.get(metric, []):
-            df.loc[pd.to_datetime(date), metric] = y_val
+    long = pd.DataFrame([(d, metric) for metric, dates in release_calendar.items() for d in dates], columns=['Date', 'metric'])
+    long['Date'] = pd.to_datetime(long['Date'])
+    long['rank'] = long['metric'].map(release_rank)
+    df = long.pivot(index='Date', columns='metric', values='rank').reindex(columns=metrics_list)
+    df.index.name = None
+    df.columns.name = None
     return df
 
+# Export pipeline: artifacts are written once per data version and format under cache/exports and
+# served from disk, so repeated downloads of unchanged data cost nothing. Excel is streamed row by
+# row with xlsxwriter's constant_memory mode; Parquet and Arrow IPC (when pyarrow is installed)
+# hold all indicators and the release calendar in one long table; zipped CSV has one file per indicator.
+# Each artifact is built by one worker at a time (the others wait on its lock and find it on disk).
+EXPORT_DIR = os.path.join(CACHE_DIR, 'exports')
+EXPORT_CACHE_SIZE = 16
+
+def _sheet_rows(df):
+    yield list(df.columns)
+    for row in df.astype(object).where(df.notna(), None).itertuples(index=False):
+        yield row
+
+def write_xlsx(path, data, release_df):
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True, 'default_date_format': 'yyyy-mm-dd'})
+    for sheet_name, df in list(data.items()) + [('Release_Dates', release_df.rename_axis('Date').reset_index())]:
+        worksheet = workbook.add_worksheet(sheet_name)
+        for row_number, row in enumerate(_sheet_rows(df)):
+            worksheet.write_row(row_number, 0, row)
+    workbook.close()
+
+# One row per (indicator, Date, field): numeric fields in value, text fields (e.g. FOMC's Rate Range %)
+# in text. The release calendar is the 'Release_Dates' indicator, with each metric's rank on its release days.
+def long_table(data, release_df):
+    parts = []
+    for key, df in list(data.items()) + [('Release_Dates', release_df.rename_axis('Date').reset_index())]:
+        part = df.melt(id_vars='Date', var_name='field', value_name='raw')
+        is_numeric = part['field'].isin(df.select_dtypes('number').columns)
+        part['value'] = pd.to_numeric(part['raw'].where(is_numeric), errors='coerce').astype('float64')
+        part['text'] = part['raw'].where(~is_numeric).astype('string')
+        part = part.drop(columns='raw').dropna(subset=['value', 'text'], how='all')
+        part.insert(0, 'indicator', key)
+        parts.append(part)
+    return pd.concat(parts, ignore_index=True)
+
+def write_parquet(path, data, release_df):
+    long_table(data, release_df).to_parquet(path, index=False)
+
+def write_arrow(path, data, release_df):
+    feather.write_feather(long_table(data, release_df), path)
+
+def write_csv_zip(path, data, release_df):
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for key, df in data.items():
+            archive.writestr(f'{key}.csv', df.to_csv(index=False))
+        archive.writestr('Release_Dates.csv', release_df.to_csv(index_label='Date'))
+
+export_writers = {'xlsx': write_xlsx, 'csv.zip': write_csv_zip}
+export_labels = {'xlsx': 'Excel (.xlsx)', 'csv.zip': 'Zipped CSV'}
+if feather is not None:
+    export_writers.update({'parquet': write_parquet, 'arrow': write_arrow})
+    export_labels.update({'parquet': 'Parquet', 'arrow': 'Arrow IPC'})
+
+# Least recently served artifacts beyond EXPORT_CACHE_SIZE; another worker may prune (or still be
+# writing, under a .tmp name) at the same time
+def _prune_exports():
+    mtimes = {}
+    for name in os.listdir(EXPORT_DIR):
+        if not name.endswith('.tmp'):
+            try:
+                mtimes[name] = os.path.getmtime(os.path.join(EXPORT_DIR, name))
+            except OSError:
+                pass
+    for name in sorted(mtimes, key=mtimes.get)[:-EXPORT_CACHE_SIZE]:
+        try:
+            os.remove(os.path.join(EXPORT_DIR, name))
+        except FileNotFoundError:
+            pass
+
+# Path of the export artifact for these frames, building it only if this version/format is not on disk yet
+def build_export(frames, export_format='xlsx'):
+    name = f'dashboard_data_{data_version(frames)}.{export_format}'
+    path = os.path.join(EXPORT_DIR, name)
+    with shared_lock('export-' + name):
+        try:
+            os.utime(path)
+            count_cache('export', True)
+            return path
+        except FileNotFoundError:
+            count_cache('export', False)
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        data = {k: v for k, v in frames.items() if not k.startswith('_') and not v.empty}
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            export_writers[export_format](tmp_path, data, create_release_df())
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    _prune_exports()
+    return path
+
+# Charts per tab; each chart is its own graph component filled by render_chart
+chart_specs = {
+    'nfp': {'series': 'nfp', 'heading': 'Nonfarm Payrolls (thousands added)'},
+    'unemp': {'series': 'unemp', 'heading': 'Unemployment Rate (%)'},
+    'claims': {'series': 'claims', 'heading': 'Jobless Claims'},
+    'cpi': {'series': 'cpi', 'heading': 'CPI (YoY %)'},
+    'pce': {'series': 'pce', 'heading': 'PCE (YoY %)'},
+    'ppi': {'series': 'ppi', 'heading': 'PPI (YoY %)'},
+    'gdp': {'series': 'gdp', 'heading': 'GDP (QoQ Annualized %)', 'overlay': True},
+    'retail': {'series': 'retail', 'heading': 'Retail Sales (MoM %)'},
+    'durable': {'series': 'durable', 'heading': 'Durable Goods Orders (MoM %)'},
+    'prod': {'series': 'prod', 'heading': 'Productivity (QoQ Annualized %)', 'overlay': True},
+    'ism': {'series': 'ism', 'heading': 'ISM Manufacturing PMI'},
+    'conf': {'series': 'conf', 'heading': 'Consumer Confidence Index'},
+    'housing': {'series': 'housing', 'heading': 'Housing Starts (Millions annualized)'},
+    'trade': {'series': 'trade', 'heading': 'Trade Balance ($ Millions)'},
+    'fomc': {'series': 'fomc', 'heading': 'FOMC Rates (Upper Bound (%))'},
+    'fomc_3d': {'series': 'fomc', 'heading': '3D FOMC Upper Rates (%)', 'chart': '3d'},
+    'corr': {'series': None, 'heading': 'Indicator Correlations', 'chart': 'heatmap'},
+}
+tab_charts = {
+    'Employment': ['nfp', 'unemp', 'claims'],
+    'Inflation & Prices': ['cpi', 'pce', 'ppi'],
+    'Growth & Sales': ['gdp', 'retail', 'durable', 'prod'],
+    'Other Indicators': ['ism', 'conf', 'housing', 'trade'],
+    'Rates & 3D View': ['fomc', 'fomc_3d'],
+    'Correlations': ['corr'],
+}
+
+# Chart kind for a chart id: the spec override (3D view) or the registry chart type
+def chart_kind(chart):
+    return chart_specs[chart].get('chart') or indicators[chart_specs[chart]['series']]['chart']
+
+chart_heights = {'3d': 500, 'heatmap': 700}
+
+def chart_block(chart, theme):
+    height = chart_heights.get(chart_kind(chart), 300)
+    spec = chart_specs[chart]
+    graph = dcc.Graph(id={'type': 'indicator-graph', 'chart': chart}, style={'height': f'{height}px'} if height != 300 else None,
+                      figure=placeholder_figure(height=height, theme=theme))
+    # Every chart carries the toggle so render_chart's MATCH inputs resolve; it is only shown for revised series
+    overlay_toggle = dcc.Checklist(id={'type': 'vintage-toggle', 'chart': chart}, options=[{'label': ' First print vs latest', 'value': 'first'}],
+                                   value=[], style={'fontSize': '12px', 'display': 'block' if spec.get('overlay') else 'none'})
+    # The server fills the chart-figure store; a client-side callback themes it and applies the view window
+    return html.Div([html.H6(spec['heading'], style={'marginBottom': '0px'}),
+                     html.P(descriptions[chart], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
+                     overlay_toggle,
+                     dcc.Store(id={'type': 'chart-figure', 'chart': chart}),
+                     dcc.Store(id={'type': 'zoom-request', 'chart': chart}),
+                     dcc.Loading(graph, type='circle')])
+
+# First prints of a revised series over the displayed window, from the vintage store (no upstream fetch).
+# Only observations first seen after the store began tracking have a real first print.
+def first_print_overlay(key, df):
+    spec = indicators[key]
+    revisions = series_revisions(spec['series'])
+    revisions = revisions[revisions['Tracked'] & revisions['Date'].isin(df['Date'])] if not df.empty else revisions.iloc[:0]
+    return pd.DataFrame({'Date': revisions['Date'].values, 'First print': revisions['First'].values * spec.get('scale', 1)})
+
+# Figure for one chart id and data token (memoized); the work behind render_chart outside a zoom
+def build_chart_figure(chart, data_token, theme='dark', overlay=False):
+    key = chart_specs[chart]['series']
+    kind = chart_kind(chart)
+    lookback = data_token['lookback'] if data_token else None
+    if kind == 'heatmap':
+        frames = load_data(data_token)
+        return memoized_figure(('corr', data_version(frames), lookback, theme),
+                               lambda: create_correlation_figure(correlation_matrix(frames, lookback), theme=theme))
+    df, status = load_series_status(data_token, key)
+    first_prints = first_print_overlay(key, df) if overlay and chart_specs[chart].get('overlay') else None
+    fig = cached_figure(df, key, lookback, 'Date', indicators[key]['label'], '', is_bar=kind == 'bar',
+                        is_3d=kind == '3d', is_trade=kind == 'trade', theme=theme, is_step=kind == 'step', overlay=first_prints)
+    return mark_status(fig, status)
+
+# Poll interval for picking up newly warmed data once the startup warm has finished
+WARM_POLL_IDLE_MS = 60000
+
+# Page styles per theme, applied client-side: header, tab content, controls, main
+theme_styles = {
+    'dark': [
+        {'position': 'fixed', 'top': 0, 'width': '100%', 'backgroundColor': '#111', 'color': '#fff', 'zIndex': 1000, 'padding': '10px'},
+        {'paddingTop': '150px', 'backgroundColor': '#111', 'color': '#fff'},
+        {'backgroundColor': '#222', 'padding': '10px', 'borderRadius': '5px'},
+        {'backgroundColor': '#111', 'color': '#fff'},
+    ],
+    'light': [
+        {'position': 'fixed', 'top': 0, 'width': '100%', 'backgroundColor': '#fff', 'color': '#000', 'zIndex': 1000, 'padding': '10px', 'borderBottom': '1px solid #ddd'},
+        {'paddingTop': '150px', 'backgroundColor': '#fff', 'color': '#000'},
+        {'backgroundColor': '#f8f9fa', 'padding': '10px', 'borderRadius': '5px', 'border': '1px solid #ddd'},
+        {'backgroundColor': '#fff', 'color': '#000'},
+    ],
+}
+# Plotly templates shipped once with the layout, so a theme switch only swaps layout.template in the browser
+figure_templates = {'dark': pio.templates['plotly_dark'].to_plotly_json(), 'light': pio.templates['plotly'].to_plotly_json()}
+
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], suppress_callback_exceptions=True)
 
 app.layout = html.Div(id='main-div', children=[
@@ -362,6 +2076,7 @@ app.layout = html.Div(id='main-div', children=[
             dcc.Tab(label='Growth & Sales', value='Growth & Sales', style={'backgroundColor': '#222', 'color': '#fff'}),
             dcc.Tab(label='Other Indicators', value='Other Indicators', style={'backgroundColor': '#222', 'color': '#fff'}),
             dcc.Tab(label='Rates & 3D View', value='Rates & 3D View', style={'backgroundColor': '#222', 'color': '#fff'}),
+            dcc.Tab(label='Correlations', value='Correlations', style={'backgroundColor': '#222', 'color': '#fff'}),
             dcc.Tab(label='Release Calendar', value='Release Calendar', style={'backgroundColor': '#222', 'color': '#fff'})
         ]),
         html.Div(style={'position': 'absolute', 'top': '10px', 'right': '10px'}, children=[
@@ -382,177 +2097,259 @@ app.layout = html.Div(id='main-div', children=[
                         dcc.Input(id='lookback-input', type='number', placeholder='Custom months', style={'width': '100px', 'margin': '5px'}),
                         html.Button('Update', id='update-btn', n_clicks=0, style={'margin': '5px'}),
                         html.Button('Download Data', id='download-btn', n_clicks=0, style={'margin': '5px'}),
+                        dcc.Dropdown(id='download-format', options=[{'label': label, 'value': fmt} for fmt, label in export_labels.items()],
+                                     value='xlsx', clearable=False, style={'width': '160px', 'margin': '5px', 'color': '#000'}),
                         dcc.Download(id='download-data')
                     ])
                 ]
             ),
-            dcc.Store(id='data-store', data=initial_serialized_data),
+            dcc.Store(id='data-store', data=initial_data_token),
+            dcc.Interval(id='warm-poll', interval=WARM_POLL_IDLE_MS if _warm_ready.is_set() else 2000),
             dcc.Store(id='current-lookback', data=120),
-            dcc.Store(id='theme-store', data='dark')
+            dcc.Store(id='theme-store', data='dark'),
+            # Client-side view window ({'months': n}) and requests for a wider window than is loaded
+            dcc.Store(id='view-range', data=None),
+            dcc.Store(id='lookback-request', data=None),
+            dcc.Store(id='figure-templates', data=figure_templates)
         ])
     ]),
     html.Div(id='tab-content', style={'paddingTop': '150px', 'backgroundColor': '#111', 'color': '#fff'})
 ])
 
-@app.callback(
+# UI-only interactions run in the browser
+app.clientside_callback(
+    '''
+    function(n, isOpen) {
+        return n ? !isOpen : isOpen;
+    }
+    ''',
     Output('controls-collapse', 'is_open'),
     Input('toggle-controls', 'n_clicks'),
     State('controls-collapse', 'is_open')
 )
-def toggle_collapse(n, is_open):
-    if n:
-        return not is_open
-    return is_open
 
-@app.callback(
+app.clientside_callback(
+    '''
+    function(value) {
+        return value ? 'dark' : 'light';
+    }
+    ''',
     Output('theme-store', 'data'),
     Input('theme-toggle', 'value')
 )
-def update_theme(value):
-    return 'dark' if value else 'light'
 
-@app.callback(
+app.clientside_callback(
+    f'''
+    function(theme) {{
+        return {json.dumps(theme_styles)}[theme === 'light' ? 'light' : 'dark'];
+    }}
+    ''',
     [Output('fixed-header', 'style'),
      Output('tab-content', 'style'),
      Output('controls-div', 'style'),
      Output('main-div', 'style')],
     Input('theme-store', 'data')
 )
-def update_styles(theme):
-    if theme == 'dark':
-        header_style = {'position': 'fixed', 'top': 0, 'width': '100%', 'backgroundColor': '#111', 'color': '#fff', 'zIndex': 1000, 'padding': '10px'}
-        content_style = {'paddingTop': '150px', 'backgroundColor': '#111', 'color': '#fff'}
-        controls_style = {'backgroundColor': '#222', 'padding': '10px', 'borderRadius': '5px'}
-        main_style = {'backgroundColor': '#111', 'color': '#fff'}
-    else:
-        header_style = {'position': 'fixed', 'top': 0, 'width': '100%', 'backgroundColor': '#fff', 'color': '#000', 'zIndex': 1000, 'padding': '10px', 'borderBottom': '1px solid #ddd'}
-        content_style = {'paddingTop': '150px', 'backgroundColor': '#fff', 'color': '#000'}
-        controls_style = {'backgroundColor': '#f8f9fa', 'padding': '10px', 'borderRadius': '5px', 'border': '1px solid #ddd'}
-        main_style = {'backgroundColor': '#fff', 'color': '#000'}
-    return header_style, content_style, controls_style, main_style
 
+# Lookback buttons: a window inside the loaded data only moves the view; a wider one also asks the server.
+# Update is the manual refresh and always asks the server.
+app.clientside_callback(
+    '''
+    function(n3m, n6m, n1y, n5y, n10y, nUpdate, custom, loaded) {
+        const buttons = {'btn-3m': 3, 'btn-6m': 6, 'btn-1y': 12, 'btn-5y': 60, 'btn-10y': 120};
+        const triggered = window.dash_clientside.callback_context.triggered;
+        if (!triggered.length) {
+            return [window.dash_clientside.no_update, window.dash_clientside.no_update];
+        }
+        const id = triggered[0].prop_id.split('.')[0];
+        const months = buttons[id] || custom || 120;
+        if (id !== 'update-btn' && loaded && months <= loaded) {
+            return [{months: months}, window.dash_clientside.no_update];
+        }
+        return [{months: months}, {lookback: months, requested: Date.now()}];
+    }
+    ''',
+    Output('view-range', 'data'),
+    Output('lookback-request', 'data'),
+    [Input('btn-3m', 'n_clicks'), Input('btn-6m', 'n_clicks'), Input('btn-1y', 'n_clicks'), Input('btn-5y', 'n_clicks'),
+     Input('btn-10y', 'n_clicks'), Input('update-btn', 'n_clicks')],
+    State('lookback-input', 'value'),
+    State('current-lookback', 'data'),
+    prevent_initial_call=True
+)
+
+# Zooms reach the server only for downsampled charts, which re-render the visible range at full resolution
+app.clientside_callback(
+    '''
+    function(relayout, base) {
+        if (!relayout || !base || !base.downsampled) {
+            return window.dash_clientside.no_update;
+        }
+        if (!('xaxis.range[0]' in relayout || 'xaxis.range' in relayout || relayout['xaxis.autorange'])) {
+            return window.dash_clientside.no_update;
+        }
+        return relayout;
+    }
+    ''',
+    Output({'type': 'zoom-request', 'chart': MATCH}, 'data'),
+    Input({'type': 'indicator-graph', 'chart': MATCH}, 'relayoutData'),
+    State({'type': 'chart-figure', 'chart': MATCH}, 'data'),
+    prevent_initial_call=True
+)
+
+# Server figure -> displayed figure: swap in the theme's template and, for date charts, apply the view
+# window with the y axis fitted to the visible points (a server zoom keeps its own range)
+app.clientside_callback(
+    '''
+    function(base, theme, view, templates) {
+        const ctx = window.dash_clientside;
+        if (!base || !base.figure) {
+            return ctx.no_update;
+        }
+        function values(array) {
+            if (Array.isArray(array)) {
+                return array;
+            }
+            if (array && array.bdata) {
+                const types = {f8: Float64Array, f4: Float32Array, i8: BigInt64Array, i4: Int32Array, i2: Int16Array,
+                               i1: Int8Array, u4: Uint32Array, u2: Uint16Array, u1: Uint8Array};
+                const bytes = Uint8Array.from(atob(array.bdata), c => c.charCodeAt(0));
+                return Array.from(new (types[array.dtype] || Float64Array)(bytes.buffer), Number);
+            }
+            return [];
+        }
+        const figure = base.figure;
+        const layout = Object.assign({}, figure.layout, {template: templates[theme === 'light' ? 'light' : 'dark']});
+        const viewChanged = ctx.callback_context.triggered.some(t => t.prop_id.startsWith('view-range'));
+        const zoomed = figure.layout.xaxis && figure.layout.xaxis.range;
+        if (view && view.months && ['line', 'bar', 'trade', 'step'].includes(base.kind) && (viewChanged || !zoomed)) {
+            const end = new Date();
+            const start = new Date(end);
+            start.setMonth(start.getMonth() - view.months);
+            const range = [start.toISOString().slice(0, 10), end.toISOString().slice(0, 10)];
+            layout.xaxis = Object.assign({}, layout.xaxis, {range: range, autorange: false});
+            let low = Infinity, high = -Infinity;
+            figure.data.forEach(trace => {
+                const xs = values(trace.x), ys = values(trace.y);
+                xs.forEach((x, i) => {
+                    // Dates arrive as epoch milliseconds in the typed wire format, ISO strings otherwise
+                    const t = typeof x === 'number' ? x : Date.parse(x);
+                    if (t >= start.getTime() && t <= end.getTime() && ys[i] !== null && isFinite(ys[i])) {
+                        low = Math.min(low, ys[i]);
+                        high = Math.max(high, ys[i]);
+                    }
+                });
+            });
+            if (low <= high) {
+                if (base.kind === 'bar' || base.kind === 'trade') {
+                    low = Math.min(low, 0);
+                    high = Math.max(high, 0);
+                }
+                const pad = (high - low) * 0.05 || 1;
+                layout.yaxis = Object.assign({}, layout.yaxis, {range: [low - pad, high + pad], autorange: false});
+            }
+        }
+        return {data: figure.data, layout: layout};
+    }
+    ''',
+    Output({'type': 'indicator-graph', 'chart': MATCH}, 'figure'),
+    Input({'type': 'chart-figure', 'chart': MATCH}, 'data'),
+    Input('theme-store', 'data'),
+    Input('view-range', 'data'),
+    State('figure-templates', 'data')
+)
+
+# Loaded window: only requests for a window wider than the loaded data reach the server
 @app.callback(
     Output('data-store', 'data'),
     Output('current-lookback', 'data'),
-    [Input('update-btn', 'n_clicks'), Input('btn-3m', 'n_clicks'), Input('btn-6m', 'n_clicks'), Input('btn-1y', 'n_clicks'),
-     Input('btn-5y', 'n_clicks'), Input('btn-10y', 'n_clicks')],
-    State('lookback-input', 'value')
+    Output('warm-poll', 'interval'),
+    Input('lookback-request', 'data'),
+    Input('warm-poll', 'n_intervals'),
+    State('current-lookback', 'data'),
+    State('data-store', 'data')
 )
-def update_data_store(update_n, btn3m, btn6m, btn1y, btn5y, btn10y, custom):
+@instrumented('update_data_store')
+def update_data_store(request, n_intervals, current_lookback, data_token):
     ctx = dash.callback_context
     if not ctx.triggered:
-        return initial_serialized_data, 120
+        return current_data(), 120, WARM_POLL_IDLE_MS if _warm_ready.is_set() else 2000
     button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    if button_id == 'btn-3m':
-        lookback = 3
-    elif button_id == 'btn-6m':
-        lookback = 6
-    elif button_id == 'btn-1y':
-        lookback = 12
-    elif button_id == 'btn-5y':
-        lookback = 60
-    elif button_id == 'btn-10y':
-        lookback = 120
-    else:
-        lookback = custom or 120
-    serialized_data = get_data(lookback)
-    return serialized_data, lookback
+    if button_id == 'warm-poll':
+        # Swap in newly warmed data (startup warm or a scheduled release refresh, from any worker)
+        # unless the user picked another window
+        adopt_shared_warm()
+        if not _warm_ready.is_set():
+            return dash.no_update, dash.no_update, dash.no_update
+        token = _warm_state['token']
+        if current_lookback != 120 or token == data_token:
+            return dash.no_update, dash.no_update, WARM_POLL_IDLE_MS
+        return token, 120, WARM_POLL_IDLE_MS
+    if not request:
+        return dash.no_update, dash.no_update, dash.no_update
+    lookback = request['lookback']
+    return start_fetch(lookback), lookback, dash.no_update
 
+# Chart tabs are restyled client-side on a theme switch; only the release tab's tables re-render
 @app.callback(
     Output('tab-content', 'children'),
     Input('tabs', 'value'),
-    Input('data-store', 'data'),
     Input('theme-store', 'data')
 )
-def render_tab_content(tab, stored_data, theme):
+@instrumented('render_tab')
+def render_tab(tab, theme):
+    triggered = [t['prop_id'] for t in dash.callback_context.triggered]
+    if triggered == ['theme-store.data'] and tab in tab_charts:
+        raise dash.exceptions.PreventUpdate
+    return render_tab_content(tab, theme)
+
+# Release calendar tab tables: verified release cadence per series, and the next few releases
+release_series_table = [
+    {'Series': 'Nonfarm Payrolls (NFP)', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
+    {'Series': 'Consumer Price Index (CPI)', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
+    {'Series': 'Gross Domestic Product (GDP)', 'Frequency': 'Quarterly', 'Notes': '3 revisions per quarter (advance, second, third estimate).'},
+    {'Series': 'FOMC Decisions', 'Frequency': 'Irregular (~8/year)', 'Notes': 'Decision days only; no revisions.'},
+    {'Series': 'Unemployment Rate', 'Frequency': 'Monthly', 'Notes': 'No revisions; released with NFP.'},
+    {'Series': 'Personal Consumption Expenditures (PCE)', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
+    {'Series': 'Retail Sales', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
+    {'Series': 'Producer Price Index (PPI)', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
+    {'Series': 'ISM Manufacturing PMI', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
+    {'Series': 'Consumer Confidence Index', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
+    {'Series': 'Housing Starts', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
+    {'Series': 'Trade Balance', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
+    {'Series': 'Jobless Claims', 'Frequency': 'Weekly', 'Notes': 'No revisions; released weekly.'},
+    {'Series': 'Durable Goods Orders', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
+    {'Series': 'Productivity', 'Frequency': 'Quarterly', 'Notes': '2 main releases per quarter (preliminary and revised).'}
+]
+
+def next_up_rows(limit=5):
+    today = datetime.date.today()
+    return [{'Series': metric, 'Next Release': release.strftime('%a %b %d, %Y'), 'Days Until': days_until(metric, today)}
+            for release, metric in upcoming_releases(today, limit=limit)]
+
+def render_tab_content(tab, theme):
     text_color = '#fff' if theme == 'dark' else '#000'
-    if tab == 'Employment':
-        return html.Div([
-            html.Div([html.H6('Nonfarm Payrolls (thousands added)', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['nfp'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('nfp', []), 'Date', 'NFP (thousands added)', '', is_bar=True, theme=theme))]),
-            html.Div([html.H6('Unemployment Rate (%)', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['unemp'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('unemp', []), 'Date', 'Unemployment Rate (%)', '', theme=theme))]),
-            html.Div([html.H6('Jobless Claims', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['claims'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('claims', []), 'Date', 'Jobless Claims', '', theme=theme))])
-        ], style={'padding': '20px 0px'})
-    elif tab == 'Inflation & Prices':
-        return html.Div([
-            html.Div([html.H6('CPI (YoY %)', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['cpi'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('cpi', []), 'Date', 'CPI (YoY %)', '', theme=theme))]),
-            html.Div([html.H6('PCE (YoY %)', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['pce'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('pce', []), 'Date', 'PCE (YoY %)', '', theme=theme))]),
-            html.Div([html.H6('PPI (YoY %)', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['ppi'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('ppi', []), 'Date', 'PPI (YoY %)', '', theme=theme))])
-        ], style={'padding': '20px 0px'})
-    elif tab == 'Growth & Sales':
-        return html.Div([
-            html.Div([html.H6('GDP (QoQ Annualized %)', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['gdp'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('gdp', []), 'Date', 'GDP (QoQ Annualized %)', '', is_bar=True, theme=theme))]),
-            html.Div([html.H6('Retail Sales (MoM %)', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['retail'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('retail', []), 'Date', 'Retail Sales (MoM %)', '', theme=theme))]),
-            html.Div([html.H6('Durable Goods Orders (MoM %)', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['durable'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('durable', []), 'Date', 'Durable Goods Orders (MoM %)', '', theme=theme))]),
-            html.Div([html.H6('Productivity (QoQ Annualized %)', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['prod'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('prod', []), 'Date', 'Productivity (QoQ Annualized %)', '', theme=theme))])
-        ], style={'padding': '20px 0px'})
-    elif tab == 'Other Indicators':
-        return html.Div([
-            html.Div([html.H6('ISM Manufacturing PMI', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['ism'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('ism', []), 'Date', 'ISM Manufacturing PMI', '', theme=theme))]),
-            html.Div([html.H6('Consumer Confidence Index', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['conf'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('conf', []), 'Date', 'Consumer Confidence Index', '', theme=theme))]),
-            html.Div([html.H6('Housing Starts (Millions annualized)', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['housing'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('housing', []), 'Date', 'Housing Starts (Millions annualized)', '', theme=theme))]),
-            html.Div([html.H6('Trade Balance ($ Millions)', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['trade'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('trade', []), 'Date', 'Trade Balance ($ Millions)', '', is_trade=True, theme=theme))])
-        ], style={'padding': '20px 0px'})
-    elif tab == 'Rates & 3D View':
-        return html.Div([
-            html.Div([html.H6('FOMC Rates (Upper Bound (%))', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['fomc'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(figure=create_figure(stored_data.get('fomc', []), 'Date', 'Upper Rate (%)', '', theme=theme))]),
-            html.Div([html.H6('3D FOMC Upper Rates (%)', style={'color': text_color, 'marginBottom': '0px'}),
-            html.P(descriptions['fomc_3d'], style={'fontSize': '12px', 'margin': '0px 0px 10px 0px'}),
-            dcc.Graph(style={'height': '500px'}, figure=create_figure(stored_data.get('fomc', []), 'Date', 'Upper Rate (%)', '', is_3d=True, theme=theme))])
-        ], style={'padding': '20px 0px'})
+    if tab in tab_charts:
+        return html.Div([chart_block(chart, theme) for chart in tab_charts[tab]], style={'padding': '20px 0px'})
     elif tab == 'Release Calendar':
-        # Define the table data based on verification
-        table_data = [
-            {'Series': 'Nonfarm Payrolls (NFP)', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
-            {'Series': 'Consumer Price Index (CPI)', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
-            {'Series': 'Gross Domestic Product (GDP)', 'Frequency': 'Quarterly', 'Notes': '3 revisions per quarter (advance, second, third estimate).'},
-            {'Series': 'FOMC Decisions', 'Frequency': 'Irregular (~8/year)', 'Notes': 'Decision days only; no revisions.'},
-            {'Series': 'Unemployment Rate', 'Frequency': 'Monthly', 'Notes': 'No revisions; released with NFP.'},
-            {'Series': 'Personal Consumption Expenditures (PCE)', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
-            {'Series': 'Retail Sales', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
-            {'Series': 'Producer Price Index (PPI)', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
-            {'Series': 'ISM Manufacturing PMI', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
-            {'Series': 'Consumer Confidence Index', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
-            {'Series': 'Housing Starts', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
-            {'Series': 'Trade Balance', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
-            {'Series': 'Jobless Claims', 'Frequency': 'Weekly', 'Notes': 'No revisions; released weekly.'},
-            {'Series': 'Durable Goods Orders', 'Frequency': 'Monthly', 'Notes': 'No revisions; released once per month.'},
-            {'Series': 'Productivity', 'Frequency': 'Quarterly', 'Notes': '2 main releases per quarter (preliminary and revised).'}
-        ]
+        next_up = next_up_rows()
         return html.Div([
-            dcc.Graph(figure=create_release_figure(theme=theme)),
+            html.H6('Next Up', style={'color': text_color}),
+            dash_table.DataTable(
+                data=next_up,
+                columns=[{'name': 'Series', 'id': 'Series'},
+                         {'name': 'Next Release', 'id': 'Next Release'},
+                         {'name': 'Days Until', 'id': 'Days Until'}],
+                style_table={'overflowX': 'auto', 'marginBottom': '20px'},
+                style_cell={'textAlign': 'left', 'minWidth': '100px', 'whiteSpace': 'normal'},
+                style_header={'backgroundColor': '#222' if theme == 'dark' else '#f8f9fa', 'fontWeight': 'bold'},
+                style_data={'backgroundColor': '#111' if theme == 'dark' else '#fff', 'color': '#fff' if theme == 'dark' else '#000'}
+            ),
+            dcc.Graph(figure=wire_figure(memoized_figure(('release', datetime.date.today(), theme), lambda: create_release_figure(theme=theme)),
+                                         'release')),
             html.H6('Release Series Details', style={'color': text_color, 'marginTop': '20px'}),
             dash_table.DataTable(
-                data=table_data,
+                data=release_series_table,
                 columns=[{'name': 'Series', 'id': 'Series'},
                          {'name': 'Frequency', 'id': 'Frequency'},
                          {'name': 'Notes', 'id': 'Notes'}],
@@ -564,23 +2361,197 @@ def render_tab_content(tab, stored_data, theme):
         ], style={'padding': '20px 0px'})
     return html.Div('Select a tab')
 
+# Whether a chart is drawn downsampled for a data token, so that zooming it needs the full-resolution frame
+def chart_downsampled(chart, data_token):
+    if chart_kind(chart) in ('heatmap', '3d'):
+        return False
+    return len(load_series(data_token, chart_specs[chart]['series'])) > LARGE_SERIES_POINTS
+
+# Figure of the visible range of a downsampled chart at full resolution, or None when the zoom needs no re-render
+def zoom_figure(chart, data_token, relayout, theme='dark'):
+    x_range = visible_range(relayout)
+    if x_range is None or not chart_downsampled(chart, data_token):
+        return None
+    key = chart_specs[chart]['series']
+    kind = chart_kind(chart)
+    df, status = load_series_status(data_token, key)
+    fig = create_figure(df, 'Date', indicators[key]['label'], '', is_bar=kind == 'bar', is_trade=kind == 'trade',
+                        is_step=kind == 'step', theme=theme, x_range=None if x_range == 'auto' else x_range)
+    return mark_status(fig, status)
+
+@app.callback(
+    Output({'type': 'chart-figure', 'chart': MATCH}, 'data'),
+    Input({'type': 'chart-figure', 'chart': MATCH}, 'id'),
+    Input('data-store', 'data'),
+    Input({'type': 'zoom-request', 'chart': MATCH}, 'data'),
+    Input({'type': 'vintage-toggle', 'chart': MATCH}, 'value'),
+    State('theme-store', 'data')
+)
+@instrumented('render_chart')
+def render_chart(graph_id, data_token, zoom, overlay, theme):
+    chart = graph_id['chart']
+    if chart not in chart_specs:
+        raise dash.exceptions.PreventUpdate
+    kind = chart_kind(chart)
+    triggered = dash.callback_context.triggered
+    if triggered and 'zoom-request' in triggered[0]['prop_id']:
+        fig = zoom_figure(chart, data_token, zoom, theme)
+        if fig is None:
+            return dash.no_update
+        return {'figure': wire_figure(fig, chart), 'kind': kind, 'downsampled': True}
+    fig = build_chart_figure(chart, data_token, theme, overlay=bool(overlay))
+    return {'figure': wire_figure(fig, chart), 'kind': kind, 'downsampled': chart_downsampled(chart, data_token)}
+
 @app.callback(
     Output('download-data', 'data'),
     Input('download-btn', 'n_clicks'),
     State('data-store', 'data'),
+    State('download-format', 'value'),
     prevent_initial_call=True
 )
-def download_data_func(n_clicks, stored_data):
-    data = {k: pd.DataFrame(v) for k, v in stored_data.items()}
-    release_df = create_release_df()
-    output = BytesIO()
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        for key, df in data.items():
-            if not df.empty:
-                df.to_excel(writer, sheet_name=key, index=False)
-        release_df.to_excel(writer, sheet_name='Release_Dates', index=True)
-    output.seek(0)
-    return dcc.send_bytes(output.getvalue(), 'dashboard_data.xlsx')
+@instrumented('download_data_func')
+def download_data_func(n_clicks, data_token, export_format):
+    frames = load_data(data_token)
+    export_format = export_format or 'xlsx'
+    path = build_export(frames, export_format)
+    observe('dashboard_export_bytes', os.path.getsize(path), SIZE_BUCKETS, format=export_format)
+    return dcc.send_file(path, filename=f'dashboard_data.{export_format}')
+
+# Prometheus scrape endpoint on the underlying Flask server
+@app.server.route('/metrics')
+def metrics():
+    return flask.Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+
+# Headless report: every tab's charts, the release calendar and its tables as one static HTML file with
+# plotly.js inlined once. Figures are built in a process pool, each chart's fragment is kept under
+# CACHE_DIR/reports/fragments with a fingerprint of its inputs, and only charts whose inputs changed are rebuilt.
+REPORT_DIR = os.path.join(CACHE_DIR, 'reports')
+REPORT_WORKERS = int(os.environ.get('DASHBOARD_REPORT_WORKERS', os.cpu_count() or 2))
+
+# Per chart (plus 'release'): the frame and first-print overlay its figure is built from
+def report_inputs(frames, lookback):
+    inputs = {}
+    for chart, spec in chart_specs.items():
+        if chart_kind(chart) == 'heatmap':
+            inputs[chart] = (correlation_matrix(frames, lookback), None)
+            continue
+        df = frames.get(spec['series'], pd.DataFrame())
+        inputs[chart] = (df, first_print_overlay(spec['series'], df) if spec.get('overlay') else None)
+    inputs['release'] = (None, None)
+    return inputs
+
+# Hash of this file's source, so fragments built by older figure code are rebuilt but a checkout or touch is not a change
+def report_source_digest():
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
+
+# Changes with the chart's data, overlay, theme and window, or with the figure code
+def report_fingerprint(chart, df, overlay, theme, lookback, source_digest):
+    parts = [chart, theme, lookback, source_digest,
+             series_versions({'df': df})['df'] if df is not None else datetime.date.today().isoformat(),
+             series_versions({'overlay': overlay})['overlay'] if overlay is not None else None]
+    return hashlib.sha1(json.dumps(parts, default=str).encode()).hexdigest()[:16]
+
+# One chart's div and Plotly.newPlot call, without plotly.js; runs in a report worker
+def report_fragment(chart, df, overlay, theme):
+    if chart == 'release':
+        fig = create_release_figure(theme=theme)
+    elif chart_kind(chart) == 'heatmap':
+        fig = create_correlation_figure(df, theme=theme)
+    else:
+        kind = chart_kind(chart)
+        fig = create_figure(df, 'Date', indicators[chart_specs[chart]['series']]['label'], '', is_bar=kind == 'bar', is_3d=kind == '3d',
+                            is_trade=kind == 'trade', is_step=kind == 'step', theme=theme, overlay=overlay)
+    return pio.to_html(fig, include_plotlyjs=False, full_html=False, div_id=f'chart-{chart}', config={'displaylogo': False})
+
+# Heading suffix for a chart whose series is stale or unavailable
+def report_status(statuses, chart):
+    status = statuses.get(chart_specs[chart]['series'], 'ok')
+    return f' <span class="status">({status})</span>' if status in status_notes else ''
+
+def report_table(rows):
+    return pd.DataFrame(rows).to_html(index=False, border=0, classes='table')
+
+def render_report_html(fragments, theme, statuses=None):
+    statuses = statuses or {}
+    page = theme_styles[theme][3]
+    panel = theme_styles[theme][2]
+    sections = []
+    for tab, charts in tab_charts.items():
+        blocks = ''.join(f'<div class="chart"><h3>{escape(chart_specs[chart]["heading"])}{report_status(statuses, chart)}</h3>'
+                         f'<p class="note">{escape(descriptions[chart])}</p>{fragments[chart]}</div>' for chart in charts)
+        sections.append(f'<section><h2>{escape(tab)}</h2>{blocks}</section>')
+    sections.append(f'<section><h2>Release Calendar</h2><h3>Next Up</h3>{report_table(next_up_rows())}{fragments["release"]}'
+                    f'<h3>Release Series Details</h3>{report_table(release_series_table)}</section>')
+    generated = datetime.datetime.now().strftime('%Y-%m-%d %H:%M')
+    return (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>Core Economic Indicators ({generated})</title>'
+            f'<style>body{{background:{page["backgroundColor"]};color:{page["color"]};font-family:sans-serif;margin:20px}}'
+            f'section{{margin-bottom:40px}}.note{{font-size:12px;margin:0 0 10px}}.status{{color:#e0a800;font-size:14px}}'
+            f'.table{{background:{panel["backgroundColor"]};border-collapse:collapse;margin-bottom:20px}}'
+            f'.table td,.table th{{padding:4px 12px;text-align:left}}</style>'
+            f'<script type="text/javascript">{get_plotlyjs()}</script></head>'
+            f'<body><h1>Core Economic Indicators</h1><p class="note">Snapshot generated {generated}</p>{"".join(sections)}</body></html>')
+
+# Environment variables set for the duration of the block (inherited by processes started in it)
+@contextlib.contextmanager
+def _environ(values):
+    saved = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+# Builds the static report and returns its path
+def build_report(output=None, lookback=120, theme='dark', workers=REPORT_WORKERS):
+    started = time.perf_counter()
+    frames = load_data(get_data(lookback))
+    inputs = report_inputs(frames, lookback)
+    fragment_dir = os.path.join(REPORT_DIR, 'fragments')
+    manifest_path = os.path.join(REPORT_DIR, 'manifest.json')
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    source_digest = report_source_digest()
+    fingerprints = {chart: report_fingerprint(chart, df, overlay, theme, lookback, source_digest) for chart, (df, overlay) in inputs.items()}
+    stale = [chart for chart in inputs
+             if manifest.get(chart) != fingerprints[chart] or not os.path.exists(os.path.join(fragment_dir, f'{chart}.html'))]
+    if stale:
+        # Spawned rather than forked (this process already runs fetch, warm and scheduler threads); the
+        # workers' import of this module starts no warm or scheduler of its own
+        with _environ(REPORT_RUN_ENV), ProcessPoolExecutor(max_workers=max(1, min(workers, len(stale))),
+                                                           mp_context=multiprocessing.get_context('spawn')) as pool:
+            futures = {chart: pool.submit(report_fragment, chart, *inputs[chart], theme) for chart in stale}
+            for chart, future in futures.items():
+                fragment = future.result().encode('utf-8')
+                _write_atomic(os.path.join(fragment_dir, f'{chart}.html'), lambda f: f.write(fragment))
+                manifest[chart] = fingerprints[chart]
+        _write_atomic(manifest_path, lambda f: json.dump(manifest, f), mode='w')
+    fragments = {}
+    for chart in inputs:
+        with open(os.path.join(fragment_dir, f'{chart}.html'), encoding='utf-8') as f:
+            fragments[chart] = f.read()
+    output = os.path.abspath(output or os.path.join(REPORT_DIR, 'dashboard.html'))
+    page = render_report_html(fragments, theme, frames.get('_status')).encode('utf-8')
+    _write_atomic(output, lambda f: f.write(page))
+    log_event('report_built', path=output, rebuilt=len(stale), reused=len(inputs) - len(stale), bytes=len(page),
+              seconds=round(time.perf_counter() - started, 3))
+    return output
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Core economic indicators dashboard')
+    parser.add_argument('--report', nargs='?', const='', metavar='PATH',
+                        help='write the static HTML report (default: cache/reports/dashboard.html) and exit instead of serving')
+    parser.add_argument('--theme', choices=sorted(theme_styles), default='dark')
+    parser.add_argument('--lookback', type=int, default=120)
+    args = parser.parse_args()
+    if args.report is not None:
+        build_report(args.report or None, lookback=args.lookback, theme=args.theme)
+    else:
+        app.run(debug=True)
\ No newline at end of file
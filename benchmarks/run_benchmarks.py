@@ -0,0 +1,282 @@
+# Offline benchmark suite for the dashboard.
+#
+# Starts the local stand-in server (standin_server.py), points the dashboard's upstream URLs at it,
+# and times the data, figure, tab and export hot paths. Results are written to benchmarks/results
+# tagged with the current commit so runs can be compared across commits:
+#
+#   python benchmarks/run_benchmarks.py
+#   python benchmarks/run_benchmarks.py --compare benchmarks/results/<older run>.json
+#   python benchmarks/run_benchmarks.py --record    # refresh fixtures from the live sources
+import argparse
+import datetime
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+sys.path.insert(0, REPO_ROOT)
+
+from standin_server import FIXTURE_DIR, SYNTHETIC_END, Fixtures, start_server
+
+LOOKBACKS = [3, 12, 60, 120]
+REGRESSION_THRESHOLD = 1.2
+
+RECORD_SOURCES = {
+    'fomc.html': 'https://en.wikipedia.org/wiki/History_of_Federal_Open_Market_Committee_actions',
+    'ism.html': 'https://www.investing.com/economic-calendar/ism-manufacturing-pmi-173',
+}
+RECORD_FRED_CODES = ['PAYEMS', 'CPIAUCSL', 'A191RL1Q225SBEA', 'UNRATE', 'PCEPI', 'RSAFS', 'PPIACO', 'UMCSENT',
+                     'HOUST', 'BOPGSTB', 'ICSA', 'DGORDER', 'PRS85006092']
+RECORD_BLS_LINES = 200000
+# Recordings are trimmed so they can be committed: FRED from RECORD_FRED_START, and the pages down to
+# the tables the parsers read
+RECORD_FRED_START = '2000-01-01'
+RECORD_TABLES = {'fomc.html': r'Fed\. Funds Rate', 'ism.html': r'id="eventHistoryTable'}
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+def trim_page(text, marker):
+    tables = [m.group(0) for m in re.finditer(r'<table\b.*?</table>', text, re.S | re.I) if re.search(marker, m.group(0))]
+    return '<html><body>\n' + '\n'.join(tables) + '\n</body></html>\n'
+
+
+def record_fixtures():
+    import requests
+    os.makedirs(os.path.join(FIXTURE_DIR, 'fred'), exist_ok=True)
+    for code in RECORD_FRED_CODES:
+        response = requests.get('https://fred.stlouisfed.org/graph/fredgraph.csv', params={'id': code, 'cosd': RECORD_FRED_START},
+                                timeout=60)
+        response.raise_for_status()
+        with open(os.path.join(FIXTURE_DIR, 'fred', f'{code}.csv'), 'w', encoding='utf-8') as f:
+            f.write(response.text)
+    for name, url in RECORD_SOURCES.items():
+        response = requests.get(url, headers={'User-Agent': USER_AGENT}, timeout=60)
+        response.raise_for_status()
+        with open(os.path.join(FIXTURE_DIR, name), 'w', encoding='utf-8') as f:
+            f.write(trim_page(response.text, RECORD_TABLES[name]))
+    # Trimmed BLS CE file: the first RECORD_BLS_LINES lines of the bulk file
+    response = requests.get('https://download.bls.gov/pub/time.series/ce/ce.data.0.Current', headers={'User-Agent': USER_AGENT},
+                            stream=True, timeout=120)
+    response.raise_for_status()
+    with open(os.path.join(FIXTURE_DIR, 'bls_ce.txt'), 'wb') as f:
+        for n, line in enumerate(response.iter_lines()):
+            if n >= RECORD_BLS_LINES:
+                break
+            f.write(line + b'\n')
+    print(f'Recorded fixtures in {FIXTURE_DIR}')
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+class Bench:
+    def __init__(self, repeat):
+        self.repeat = repeat
+        self.results = {}
+
+    def run(self, name, fn, setup=None, repeat=None):
+        times = []
+        for _ in range(repeat or self.repeat):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        self.results[name] = {'min': min(times), 'median': statistics.median(times), 'mean': statistics.mean(times), 'runs': len(times)}
+        print(f'{name:<55} median {self.results[name]["median"] * 1000:10.2f} ms')
+
+
+def reset_memory(dashboard):
+    for cache in (dashboard._data_cache, dashboard._fetch_jobs, dashboard._figure_cache, dashboard._last_good, dashboard._correlation_state):
+        cache.clear()
+    shutil.rmtree(dashboard.SHARED_DIR, ignore_errors=True)
+
+
+def reset_store(dashboard):
+    reset_memory(dashboard)
+    for path in (dashboard.SERIES_DB_PATH, dashboard.BLS_CE_PATH, dashboard.BLS_CE_INDEX_PATH):
+        if os.path.exists(path):
+            os.remove(path)
+    shutil.rmtree(dashboard.HTTP_CACHE_DIR, ignore_errors=True)
+
+
+# Every stored series due for an inline upstream check, with the HTTP cache kept (upstream answers 304)
+def expire_store(dashboard):
+    reset_memory(dashboard)
+    for spec in dashboard.indicators.values():
+        if spec['series']:
+            dashboard.store_expire(spec['series'])
+
+
+def reset_exports(dashboard):
+    shutil.rmtree(dashboard.EXPORT_DIR, ignore_errors=True)
+
+
+def run_suite(dashboard, fixtures, bench):
+    # get_data against the stand-in: cold (empty series store) and warm (store populated, memory caches empty)
+    for lookback in LOOKBACKS:
+        bench.run(f'get_data[{lookback}] cold store', lambda: dashboard.get_data(lookback), setup=lambda: reset_store(dashboard))
+    dashboard.get_data(max(LOOKBACKS))
+    for lookback in LOOKBACKS:
+        bench.run(f'get_data[{lookback}] warm store', lambda: dashboard.get_data(lookback), setup=lambda: reset_memory(dashboard))
+    bench.run('get_data[120] expired store, unchanged upstream', lambda: dashboard.get_data(120), setup=lambda: expire_store(dashboard))
+    # Build already published by another worker: only this worker's in-memory cache is empty
+    dashboard.get_data(120)
+    bench.run('get_data[120] shared cache', lambda: dashboard.get_data(120), setup=dashboard._data_cache.clear)
+
+    # Parse steps on the recorded/synthetic payloads, without HTTP
+    fred_codes = dashboard.fred_codes
+    fred_text = fixtures.fredgraph_csv(fred_codes, [])
+    bench.run('parse fred batch', lambda: dashboard.parse_fred_batch(fred_text, fred_codes))
+    bench.run('parse fomc html', lambda: dashboard.parse_fomc_html(fixtures.fomc_html, datetime.datetime(1900, 1, 1)))
+    bench.run('parse ism html', lambda: dashboard.parse_ism_html(fixtures.ism_html))
+    bls_lines = fixtures.bls.splitlines()
+    bench.run('parse bls lines', lambda: dashboard._bls_parse_lines(bls_lines))
+    bls_ids = [line.split(b'\t', 1)[0].strip().decode() for line in bls_lines[1:40000:10000]]
+    bench.run('fetch_bls_series cold (download + index)', lambda: dashboard.fetch_bls_series(bls_ids), setup=lambda: reset_store(dashboard))
+    bench.run('fetch_bls_series indexed', lambda: dashboard.fetch_bls_series(bls_ids))
+
+    # Figures per chart kind, built directly (no memoization)
+    token = dashboard.get_data(120)
+    frames = dashboard.load_data(token)
+
+    # Vintage store queries (index cached in memory after the first call)
+    gdp_series = dashboard.indicators['gdp']['series']
+    bench.run('series_as_of[gdp]', lambda: dashboard.series_as_of(gdp_series, datetime.date.today() - datetime.timedelta(days=90)))
+    bench.run('series_revisions[gdp]', lambda: dashboard.series_revisions(gdp_series))
+    figure_cases = {
+        'line': ('cpi', {}),
+        'bar': ('nfp', {'is_bar': True}),
+        'trade': ('trade', {'is_trade': True}),
+        'step': ('fomc', {'is_step': True}),
+        '3d': ('fomc', {'is_3d': True}),
+    }
+    for kind, (key, flags) in figure_cases.items():
+        df = frames.get(key, dashboard.pd.DataFrame())
+        bench.run(f'create_figure[{kind}]', lambda: dashboard.create_figure(df, 'Date', dashboard.indicators[key]['label'], '', **flags))
+    long_df = dashboard.pd.DataFrame({'Date': dashboard.pd.date_range('1970-01-01', periods=20000, freq='D')})
+    long_df['Value'] = dashboard.np.cumsum(dashboard.np.random.default_rng(0).normal(size=len(long_df)))
+    gdp = frames.get('gdp', dashboard.pd.DataFrame())
+    bench.run('create_figure[bar + first print]', lambda: dashboard.create_figure(
+        gdp, 'Date', dashboard.indicators['gdp']['label'], '', is_bar=True, overlay=dashboard.first_print_overlay('gdp', gdp)))
+    bench.run('create_figure[large line]', lambda: dashboard.create_figure(long_df, 'Date', 'Value', ''))
+    bench.run('create_figure[heatmap]', lambda: dashboard.create_correlation_figure(dashboard.correlation_matrix(frames, 120)),
+              setup=dashboard._correlation_state.clear)
+    bench.run('create_release_figure', lambda: dashboard.create_release_figure())
+    large_fig = dashboard.create_figure(long_df, 'Date', 'Value', '')
+    bench.run('compact_figure[large line]', lambda: dashboard.compact_figure(large_fig))
+
+    # Every tab: layout plus each chart's figure, with an empty and a warm figure cache
+    for tab in list(dashboard.tab_charts) + ['Release Calendar']:
+        def render(tab=tab):
+            dashboard.render_tab_content(tab, 'dark')
+            for chart in dashboard.tab_charts.get(tab, []):
+                dashboard.build_chart_figure(chart, token, 'dark')
+        bench.run(f'render_tab_content[{tab}] cold', render, setup=dashboard._figure_cache.clear)
+        bench.run(f'render_tab_content[{tab}] cached', render)
+
+    # Downloads: first build of each format and repeat download of unchanged data
+    for export_format in dashboard.export_writers:
+        bench.run(f'download_data_func[{export_format}] cold', lambda: dashboard.download_data_func(1, token, export_format),
+                  setup=lambda: reset_exports(dashboard))
+        bench.run(f'download_data_func[{export_format}] cached', lambda: dashboard.download_data_func(1, token, export_format))
+
+    # Static report: every chart rebuilt in the process pool, then a rerun over unchanged data
+    report_path = os.path.join(dashboard.REPORT_DIR, 'bench.html')
+    bench.run('build_report cold', lambda: dashboard.build_report(report_path),
+              setup=lambda: shutil.rmtree(dashboard.REPORT_DIR, ignore_errors=True))
+    bench.run('build_report unchanged', lambda: dashboard.build_report(report_path))
+
+    # Response size per chart, as plain JSON and in the typed-array wire format
+    payloads = {chart: dashboard.payload_sizes(dashboard.build_chart_figure(chart, token, 'dark')) for chart in dashboard.chart_specs}
+    for chart, sizes in payloads.items():
+        print(f'{"payload[" + chart + "]":<55} json {sizes["json"]:9d} B   typed {sizes["typed"]:9d} B   {sizes["typed"] / sizes["json"]:5.2f}x')
+    total_json = sum(sizes['json'] for sizes in payloads.values())
+    total_typed = sum(sizes['typed'] for sizes in payloads.values())
+    print(f'{"payload[all charts]":<55} json {total_json:9d} B   typed {total_typed:9d} B   {total_typed / total_json:5.2f}x')
+    return payloads
+
+
+def compare(results, previous_path):
+    with open(previous_path) as f:
+        previous = json.load(f)
+    print(f'\nCompared with {previous["commit"]} ({os.path.basename(previous_path)}):')
+    if previous.get('synthetic_end') != SYNTHETIC_END.date().isoformat():
+        print(f'Warning: synthetic fixtures end {SYNTHETIC_END.date()} here and {previous.get("synthetic_end")} there; timings are not comparable')
+    regressions = 0
+    for name, result in results.items():
+        if name not in previous['results']:
+            continue
+        ratio = result['median'] / previous['results'][name]['median']
+        flag = '  REGRESSION' if ratio > REGRESSION_THRESHOLD else ''
+        regressions += bool(flag)
+        print(f'{name:<55} {ratio:6.2f}x{flag}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline dashboard benchmarks')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='results file (default: benchmarks/results/<timestamp>-<commit>.json)')
+    parser.add_argument('--compare', help='earlier results file to compare against')
+    parser.add_argument('--record', action='store_true', help='record fixtures from the live sources and exit')
+    args = parser.parse_args()
+    if args.record:
+        record_fixtures()
+        return 0
+
+    fixtures = Fixtures()
+    server, urls = start_server(fixtures)
+    cache_dir = tempfile.mkdtemp(prefix='dashboard-bench-')
+    os.environ.update(urls)
+    os.environ.update({'DASHBOARD_CACHE_DIR': cache_dir, 'DASHBOARD_STARTUP_MODE': 'blocking', 'DASHBOARD_REFRESH_SCHEDULER': '0'})
+    try:
+        start = time.perf_counter()
+        import Core_Economic_Indicators_and_Releases_20250803 as dashboard
+        import_seconds = time.perf_counter() - start
+        print(f'{"import (blocking startup)":<55} {import_seconds * 1000:17.2f} ms')
+        bench = Bench(args.repeat)
+        payloads = run_suite(dashboard, fixtures, bench)
+    finally:
+        server.shutdown()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    commit = git_commit()
+    run = {
+        'commit': commit,
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': dashboard.pd.__version__,
+        'fixtures': {'recorded': sorted(fixtures.recorded)},
+        'synthetic_end': SYNTHETIC_END.date().isoformat(),
+        'upstream': dict(server.stats),
+        'import_seconds': import_seconds,
+        'results': bench.results,
+        'payload_bytes': payloads,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f'{datetime.datetime.now():%Y%m%d-%H%M%S}-{commit}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(run, f, indent=2)
+    print(f'\nStand-in served {server.stats["requests"]} requests, {server.stats["bytes"] / 1e6:.1f} MB')
+    print(f'Results written to {output}')
+    if args.compare:
+        return 1 if compare(bench.results, args.compare) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+# Local stand-in for FRED, BLS, Wikipedia and investing.com used by the offline benchmark suite.
+# Replays recorded responses from benchmarks/fixtures (see run_benchmarks.py --record) and falls back
+# to deterministic synthetic fixtures in the same formats when nothing has been recorded, per fixture.
+# The committed fixtures are the FOMC decision table and the ISM print history in their trimmed recorded
+# form; FRED and BLS are synthetic until --record is run against the live sources.
+import hashlib
+import os
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+import numpy as np
+import pandas as pd
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Native frequency of the FRED codes that are not monthly
+SYNTHETIC_FRED_FREQ = {'ICSA': 'W-SAT', 'A191RL1Q225SBEA': 'QS', 'PRS85006092': 'QS'}
+SYNTHETIC_START = '1990-01-01'
+# Fixed end of the synthetic data, so volumes and ETags (and so timings) are the same on every day and commit.
+# The dashboard's lookback windows end today: move this forward, and start a new --compare baseline, when the
+# short windows (3 and 12 months) approach it.
+SYNTHETIC_END = pd.Timestamp(os.environ.get('BENCH_SYNTHETIC_END', '2026-09-30'))
+SYNTHETIC_BLS_SERIES = 400
+# investing.com's history table shows the last half year of prints
+SYNTHETIC_ISM_PRINTS = 6
+
+
+def _seed(name):
+    return sum(ord(c) for c in name)
+
+
+def synthetic_fred(code):
+    dates = pd.date_range(SYNTHETIC_START, SYNTHETIC_END, freq=SYNTHETIC_FRED_FREQ.get(code, 'MS'))
+    rng = np.random.default_rng(_seed(code))
+    values = 100 + np.cumsum(rng.normal(0.2, 1.0, len(dates)))
+    return pd.Series(np.round(values, 3), index=dates, name=code)
+
+
+def synthetic_fomc_html():
+    rng = np.random.default_rng(_seed('fomc'))
+    dates = pd.date_range('2000-01-01', SYNTHETIC_END, freq='45D')
+    upper = np.clip(np.round(np.cumsum(rng.choice([-0.25, 0, 0, 0.25], len(dates))) * 4) / 4 + 2.5, 0.25, 6.5)
+    rows = ''.join(
+        f'<tr><td>{d.strftime("%B %d, %Y")}</td><td>0</td><td>0</td><td>{u - 0.25:.2f}%–{u:.2f}%</td><td>12-0</td><td>Notes</td></tr>'
+        for d, u in zip(dates[::-1], upper[::-1])
+    )
+    filler = ''.join(f'<tr><td>{i}</td><td>Event {i}</td></tr>' for i in range(200))
+    return (
+        '<html><body><table class="wikitable"><tr><th>Year</th><th>Event</th></tr>' + filler + '</table>'
+        '<table class="wikitable"><tr><th>Date</th><th>Increase</th><th>Decrease</th><th>Fed. Funds Rate</th>'
+        '<th>Votes</th><th>Notes</th></tr>' + rows + '</table></body></html>'
+    )
+
+
+def synthetic_ism_html():
+    rng = np.random.default_rng(_seed('ism'))
+    releases = pd.date_range(end=SYNTHETIC_END, periods=SYNTHETIC_ISM_PRINTS, freq='MS')[::-1]
+    rows = ''
+    for release in releases:
+        reference = release - pd.DateOffset(months=1)
+        rows += (f'<tr><td>{release.strftime("%b %d, %Y")} ({reference.strftime("%b")})</td><td>10:00</td>'
+                 f'<td>{rng.normal(50, 3):.1f}</td><td>{rng.normal(50, 3):.1f}</td><td>{rng.normal(50, 3):.1f}</td><td></td></tr>')
+    filler = ''.join(f'<table><tr><td>Widget {i}</td></tr></table>' for i in range(50))
+    return (
+        '<html><body>' + filler + '<table id="eventHistoryTable173"><tr><th>Release Date</th><th>Time</th><th>Actual</th>'
+        '<th>Forecast</th><th>Previous</th><th></th></tr>' + rows + '</table></body></html>'
+    )
+
+
+def synthetic_bls():
+    rng = np.random.default_rng(_seed('bls'))
+    lines = ['series_id        \tyear\tperiod\t       value\tfootnote_codes']
+    years = range(2006, SYNTHETIC_END.year + 1)
+    for n in range(SYNTHETIC_BLS_SERIES):
+        series_id = f'CES{n:08d}01'
+        level = rng.uniform(100, 20000)
+        for year in years:
+            for month in range(1, 14):
+                lines.append(f'{series_id:<17}\t{year}\tM{month:02d}\t{level:12.1f}\t')
+                level += rng.normal(0, 10)
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def _read(path, mode='r'):
+    with open(path, mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as f:
+        return f.read()
+
+
+# Recorded fixture if present, synthetic otherwise; recorded lists the fixtures read from disk
+class Fixtures:
+    def __init__(self, fixture_dir=FIXTURE_DIR):
+        self.fixture_dir = fixture_dir
+        self.recorded = set()
+        self._fred = {}
+        self._lock = threading.Lock()
+        self.fomc_html = self._recorded('fomc.html') or synthetic_fomc_html()
+        self.ism_html = self._recorded('ism.html') or synthetic_ism_html()
+        self.bls = self._recorded('bls_ce.txt', 'rb') or synthetic_bls()
+
+    def _recorded(self, name, mode='r'):
+        path = os.path.join(self.fixture_dir, name)
+        if not os.path.exists(path):
+            return None
+        self.recorded.add(name)
+        return _read(path, mode)
+
+    def fred(self, code):
+        with self._lock:
+            if code not in self._fred:
+                path = os.path.join(self.fixture_dir, 'fred', f'{code}.csv')
+                if os.path.exists(path):
+                    self.recorded.add(f'fred/{code}.csv')
+                    df = pd.read_csv(path, na_values=['.'])
+                    self._fred[code] = pd.Series(df[code].values, index=pd.to_datetime(df['observation_date']), name=code)
+                else:
+                    self._fred[code] = synthetic_fred(code)
+            return self._fred[code]
+
+    # fredgraph.csv for several ids, each from its own cosd, outer-joined on observation_date
+    def fredgraph_csv(self, codes, starts):
+        columns = []
+        for code, start in zip(codes, starts + [None] * (len(codes) - len(starts))):
+            series = self.fred(code)
+            columns.append(series[series.index >= pd.Timestamp(start)] if start else series)
+        df = pd.concat(columns, axis=1).sort_index()
+        df.index.name = 'observation_date'
+        return df.reset_index().to_csv(index=False, date_format='%Y-%m-%d')
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        fixtures = self.server.fixtures
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == '/fred/graph/fredgraph.csv':
+            codes = query.get('id', [''])[0].split(',')
+            starts = query['cosd'][0].split(',') if 'cosd' in query else []
+            self._send(fixtures.fredgraph_csv(codes, starts).encode(), 'text/csv')
+        elif url.path == '/bls/ce.data.0.Current':
+            self._send(fixtures.bls, 'text/plain')
+        elif url.path == '/fomc':
+            self._send(fixtures.fomc_html.encode(), 'text/html')
+        elif url.path == '/ism':
+            self._send(fixtures.ism_html.encode(), 'text/html')
+        else:
+            self._send(b'not found', 'text/plain', status=404)
+
+    # Content-hash ETags, answering a matching If-None-Match with an empty 304 like the real sources.
+    # Bodies are UTF-8 and say so, as the real sources do (requests would otherwise decode text/* as
+    # ISO-8859-1 and mangle e.g. the en dash in the FOMC rate ranges)
+    def _send(self, body, content_type, status=200):
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        not_modified = status == 200 and self.headers.get('If-None-Match') == etag
+        self.send_response(304 if not_modified else status)
+        self.send_header('Content-Type', content_type + '; charset=utf-8')
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', '0' if not_modified else str(len(body)))
+        self.end_headers()
+        if not not_modified:
+            self.wfile.write(body)
+        with self.server.stats_lock:
+            self.server.stats['requests'] += 1
+            self.server.stats['not_modified'] += not_modified
+            self.server.stats['bytes'] += 0 if not_modified else len(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Start the stand-in on a free local port; returns (server, {source: url}) for the DASHBOARD_*_URL overrides
+def start_server(fixtures=None):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.daemon_threads = True
+    server.fixtures = fixtures or Fixtures()
+    server.stats = {'requests': 0, 'not_modified': 0, 'bytes': 0}
+    server.stats_lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, name='standin-server', daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    urls = {
+        'DASHBOARD_FRED_URL': base + '/fred/graph/fredgraph.csv',
+        'DASHBOARD_BLS_URL': base + '/bls/ce.data.0.Current',
+        'DASHBOARD_FOMC_URL': base + '/fomc',
+        'DASHBOARD_ISM_URL': base + '/ism',
+    }
+    return server, urls
@@ -0,0 +1,17 @@
+# The dashboard module imported once per session with no startup warm or release scheduler,
+# against a private cache dir and no reachable upstream.
+import importlib
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='session')
+def dashboard(tmp_path_factory):
+    os.environ.update({'DASHBOARD_CACHE_DIR': str(tmp_path_factory.mktemp('cache')), 'DASHBOARD_STARTUP_MODE': 'off',
+                       'DASHBOARD_REFRESH_SCHEDULER': '0'})
+    sys.path.insert(0, REPO_ROOT)
+    return importlib.import_module('Core_Economic_Indicators_and_Releases_20250803')
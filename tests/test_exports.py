@@ -0,0 +1,49 @@
+# Export artifacts: the long Parquet/Arrow table keeps text fields and the release calendar, and
+# concurrent builds and prunes of the export directory do not trip over each other.
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+def frames(dashboard, offset=0):
+    dates = pd.date_range('2024-01-01', periods=6, freq='MS')
+    return {
+        'cpi': pd.DataFrame({'Date': dates, dashboard.indicators['cpi']['label']: [3.1 + offset, 3.2, 3.5, 3.4, 3.3, 3.0]}),
+        'fomc': pd.DataFrame({'Date': dates[:2], 'Rate Range %': ['5.25-5.50', '5.25-5.50'], 'Upper Rate %': [5.5, 5.5]}),
+    }
+
+
+def test_long_table_keeps_text_and_release_calendar(dashboard):
+    table = dashboard.long_table(frames(dashboard), dashboard.create_release_df())
+    fomc = table[table['indicator'] == 'fomc']
+    assert fomc.loc[fomc['field'] == 'Rate Range %', 'text'].tolist() == ['5.25-5.50', '5.25-5.50']
+    assert fomc.loc[fomc['field'] == 'Upper Rate %', 'value'].tolist() == [5.5, 5.5]
+    releases = table[table['indicator'] == 'Release_Dates']
+    assert not releases.empty and releases['value'].notna().all()
+
+
+def test_concurrent_builds_share_one_artifact(dashboard):
+    export_format = 'parquet' if 'parquet' in dashboard.export_writers else 'csv.zip'
+    data = frames(dashboard)
+    with ThreadPoolExecutor(4) as pool:
+        paths = list(pool.map(lambda _: dashboard.build_export(data, export_format), range(8)))
+    assert len(set(paths)) == 1 and os.path.exists(paths[0])
+    assert not [name for name in os.listdir(dashboard.EXPORT_DIR) if name.endswith('.tmp')]
+    if export_format == 'parquet':
+        assert 'Rate Range %' in set(pd.read_parquet(paths[0])['field'])
+
+
+def test_prune_ignores_files_already_removed(dashboard, monkeypatch):
+    for offset in range(3):
+        dashboard.build_export(frames(dashboard, offset), 'csv.zip')
+    monkeypatch.setattr(dashboard, 'EXPORT_CACHE_SIZE', 1)
+    real_remove = os.remove
+
+    def remove(path):
+        real_remove(path)
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(dashboard.os, 'remove', remove)
+    dashboard._prune_exports()
+    monkeypatch.setattr(dashboard.os, 'remove', real_remove)
+    assert len(os.listdir(dashboard.EXPORT_DIR)) == 1
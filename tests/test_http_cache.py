@@ -0,0 +1,25 @@
+# The HTTP cache keeps only the HTTP_CACHE_SIZE most recently stored entries.
+import os
+import time
+
+import requests
+
+
+def response(url, body):
+    resp = requests.Response()
+    resp.url = url
+    resp.status_code = 200
+    resp._content = body
+    resp.headers['ETag'] = '"' + str(hash(body)) + '"'
+    return resp
+
+
+def test_cache_is_pruned_to_size(dashboard, monkeypatch):
+    monkeypatch.setattr(dashboard, 'HTTP_CACHE_SIZE', 3)
+    urls = [f'http://example.test/fredgraph.csv?cosd={n}' for n in range(6)]
+    for n, url in enumerate(urls):
+        dashboard.remember_response(response(url, f'body {n}'.encode()))
+        stored_at = time.time() - 100 + n
+        os.utime(dashboard._http_cache_paths(url)[0], (stored_at, stored_at))
+    assert len(os.listdir(dashboard.HTTP_CACHE_DIR)) == 6
+    assert [url for url in urls if dashboard._http_cache_meta(url)] == urls[3:]
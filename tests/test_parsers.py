@@ -0,0 +1,56 @@
+# Upstream parsers on small pages in each source's format: FOMC rate ranges and table, ISM print history
+# and the multi-id FRED batch CSV.
+import pandas as pd
+
+
+def test_split_rate_range(dashboard):
+    lower, upper = dashboard.split_rate_range(pd.Series(['4.25%–4.50%', '0.25-0.50', '5.00%[12]', '1.00 — 1.25%', 'n/a']))
+    assert lower.tolist()[:4] == [4.25, 0.25, 5.0, 1.0]
+    assert upper.tolist()[:4] == [4.5, 0.5, 5.0, 1.25]
+    assert lower.isna().tolist()[4] and upper.isna().tolist()[4]
+
+
+def test_parse_fomc_html_finds_the_decision_table(dashboard):
+    html = ('<table class="wikitable"><tr><th>Year</th><th>Event</th></tr><tr><td>2001</td><td>Other</td></tr></table>'
+            '<table class="wikitable"><tr><th>Date</th><th>Fed. Funds Rate</th><th>Votes</th></tr>'
+            '<tr><td>December 18, 2024</td><td>4.25%–4.50%</td><td>11–1</td></tr>'
+            '<tr><td>November 7, 2024[3]</td><td>4.50%–4.75%</td><td>12–0</td></tr>'
+            '<tr><td>Unscheduled</td><td>—</td><td></td></tr>'
+            '<tr><td>December 16, 2008</td><td>0%–0.25%</td><td>10–0</td></tr></table>')
+    data = dashboard.parse_fomc_html(html, pd.Timestamp('2020-01-01'))
+    assert data['Date'].tolist() == [pd.Timestamp('2024-12-18'), pd.Timestamp('2024-11-07')]
+    assert data['Value'].tolist() == ['4.25-4.50', '4.50-4.75']
+
+
+def ism_page(rows):
+    cells = ''.join(f'<tr><td>{release}</td><td>10:00</td><td>{actual}</td><td></td><td>50.0</td><td></td></tr>' for release, actual in rows)
+    return ('<html><body><table><tr><td>Widget</td></tr></table><table id="eventHistoryTable173"><tr><th>Release Date</th>'
+            '<th>Time</th><th>Actual</th><th>Forecast</th><th>Previous</th><th></th></tr>' + cells + '</table></body></html>')
+
+
+def test_parse_ism_html_dates_prints_by_reference_month(dashboard):
+    html = ism_page([('Feb 03, 2025 (Jan)', '50.9'), ('Jan 03, 2025 (Dec)', '49.3'), ('Dec 02, 2024 (Nov)', '48.4')])
+    data = dashboard.parse_ism_html(html)
+    # The January release reports December of the previous year
+    assert data['Date'].tolist() == [pd.Timestamp('2024-11-01'), pd.Timestamp('2024-12-01'), pd.Timestamp('2025-01-01')]
+    assert data['ISM Manufacturing PMI'].tolist() == [48.4, 49.3, 50.9]
+    assert dashboard.parse_ism_html(html, lookback=2)['Date'].tolist() == [pd.Timestamp('2024-12-01'), pd.Timestamp('2025-01-01')]
+
+
+def test_parse_ism_html_without_history_table(dashboard):
+    assert dashboard.parse_ism_html('<html><body><table><tr><td>Widget</td></tr></table></body></html>').empty
+
+
+def test_parse_fred_batch_splits_mixed_frequencies(dashboard):
+    text = ('observation_date,PAYEMS,A191RL1Q225SBEA,ICSA\n'
+            '2024-01-01,157000,1.6,\n'
+            '2024-01-06,,,202000\n'
+            '2024-02-01,157200,.,\n'
+            '2024-04-01,.,3.0,\n')
+    data = dashboard.parse_fred_batch(text, ['PAYEMS', 'A191RL1Q225SBEA', 'ICSA', 'UNRATE'])
+    assert set(data) == {'PAYEMS', 'A191RL1Q225SBEA', 'ICSA'}
+    assert data['PAYEMS']['Date'].tolist() == [pd.Timestamp('2024-01-01'), pd.Timestamp('2024-02-01')]
+    assert data['PAYEMS']['Value'].tolist() == [157000, 157200]
+    assert data['A191RL1Q225SBEA']['Value'].tolist() == [1.6, 3.0]
+    assert data['ICSA']['Date'].tolist() == [pd.Timestamp('2024-01-06')]
+    assert list(data['ICSA'].columns) == ['Date', 'Value']
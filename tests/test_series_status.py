@@ -0,0 +1,35 @@
+# Per-chart status: a chart resolves only its own series of an in-flight fetch and shows when it is unavailable.
+import time
+from concurrent.futures import Future
+
+import pandas as pd
+
+
+def fetch_job(dashboard, version, ready, deadline):
+    pending = Future()
+    futures = {key: ready.get(key, pending) for key in dashboard.indicators}
+    dashboard._fetch_jobs[version] = (futures, 120, time.time() + deadline, time.time())
+    return {'version': version, 'lookback': 120}
+
+
+def test_chart_does_not_wait_on_other_series(dashboard):
+    nfp = Future()
+    nfp.set_result(pd.DataFrame({'Date': pd.date_range('2020-01-01', periods=12, freq='MS'),
+                                 dashboard.indicators['nfp']['label']: range(12)}))
+    token = fetch_job(dashboard, 'job-progressive', {'nfp': nfp}, deadline=30)
+    try:
+        started = time.perf_counter()
+        fig = dashboard.build_chart_figure('nfp', token)
+        assert time.perf_counter() - started < 5
+        assert not fig.layout.annotations
+    finally:
+        dashboard._fetch_jobs.pop('job-progressive', None)
+
+
+def test_unavailable_series_is_marked(dashboard):
+    token = fetch_job(dashboard, 'job-unavailable', {}, deadline=0)
+    try:
+        fig = dashboard.build_chart_figure('cpi', token)
+        assert fig.layout.annotations[-1].text == dashboard.status_notes['unavailable']
+    finally:
+        dashboard._fetch_jobs.pop('job-unavailable', None)
@@ -0,0 +1,37 @@
+# Smoke test: the app serves its page and layout, and every tab and chart renders from a full frame set.
+import numpy as np
+import pandas as pd
+
+FREQUENCIES = {'M': 'MS', 'Q': 'QS', 'W': 'W-SAT'}
+
+
+def full_frames(dashboard):
+    rng = np.random.default_rng(0)
+    frames = {'_status': {}}
+    for key, spec in dashboard.indicators.items():
+        if spec['freq'] is None:
+            fomc = pd.DataFrame({'Date': pd.to_datetime(['2023-07-26', '2024-09-18', '2024-11-07', '2024-12-18']),
+                                 'Rate Range %': ['5.25-5.50', '4.75-5.00', '4.50-4.75', '4.25-4.50']})
+            frames[key] = dashboard.fomc_step_series(fomc)
+        else:
+            dates = pd.date_range('2015-01-01', '2025-06-30', freq=FREQUENCIES[spec['freq']])
+            frames[key] = pd.DataFrame({'Date': dates, spec['label']: 50 + np.cumsum(rng.normal(0, 1, len(dates)))})
+        frames['_status'][key] = 'ok'
+    return frames
+
+
+def test_app_serves_page_and_layout(dashboard):
+    client = dashboard.app.server.test_client()
+    assert client.get('/').status_code == 200
+    assert client.get('/_dash-layout').status_code == 200
+
+
+def test_every_tab_and_chart_renders(dashboard):
+    token = dashboard.cache_put(full_frames(dashboard), 120)
+    for tab in list(dashboard.tab_charts) + ['Release Calendar']:
+        assert dashboard.render_tab_content(tab, 'dark') is not None
+    for chart in dashboard.chart_specs:
+        fig = dashboard.build_chart_figure(chart, token)
+        assert fig.data, chart
+        assert not fig.layout.annotations or fig.layout.annotations[-1].text not in dashboard.status_notes.values(), chart
+        dashboard.wire_figure(fig, chart)
@@ -0,0 +1,47 @@
+# Routine store refreshes re-fetch a revision window, so revised recent prints replace the stored ones,
+# and scheduled series whose release was missed go back to the routine refresh.
+import time
+
+import pandas as pd
+
+
+def monthly(values, start='2024-01-01'):
+    return pd.DataFrame({'Date': pd.date_range(start, periods=len(values), freq='MS'), 'Value': values})
+
+
+def test_refresh_asks_for_revision_window(dashboard):
+    dashboard.store_write('TEST_WINDOW', monthly(range(36), start='2022-01-01'))
+    now = time.time()
+    meta = (pd.Timestamp('2022-01-01'), now - dashboard.STORE_REFRESH_SECONDS - 1)
+    since = dashboard._sync_since('TEST_WINDOW', pd.Timestamp('2023-01-01'), meta, now)
+    assert since == pd.Timestamp('2024-12-01') - pd.DateOffset(months=dashboard.STORE_REVISION_MONTHS)
+    assert dashboard._sync_since('TEST_WINDOW', pd.Timestamp('2023-01-01'), (meta[0], now), now) is None
+
+
+def test_revised_print_reaches_store(dashboard):
+    requested = []
+
+    def download(since):
+        requested.append(pd.Timestamp(since))
+        return monthly([1.0, 2.0, 3.0, 4.0]) if len(requested) == 1 else monthly([1.0, 2.5, 3.0, 4.0, 5.0])
+
+    start = pd.Timestamp('2024-01-01')
+    dashboard.sync_series('TEST_REVISED', start, download)
+    dashboard.store_expire('TEST_REVISED')
+    dashboard.sync_series('TEST_REVISED', start, download)
+    assert requested[1] <= pd.Timestamp('2024-02-01')
+    assert dashboard.store_read('TEST_REVISED', start)['Value'].tolist() == [1.0, 2.5, 3.0, 4.0, 5.0]
+
+
+def test_missed_release_falls_back_to_routine_refresh(dashboard):
+    now = time.time()
+    tomorrow = (pd.Timestamp.now() + pd.Timedelta(days=1)).date()
+    dashboard.scheduled_series['TEST_SCHEDULED'] = [tomorrow]
+    try:
+        assert dashboard._refresh_seconds('TEST_SCHEDULED', now) == dashboard.SCHEDULED_REFRESH_SECONDS
+        dashboard._set_release_missed(['TEST_SCHEDULED'], True)
+        assert dashboard._refresh_seconds('TEST_SCHEDULED', now) == dashboard.STORE_REFRESH_SECONDS
+        dashboard._set_release_missed(['TEST_SCHEDULED'], False)
+        assert dashboard._refresh_seconds('TEST_SCHEDULED', now) == dashboard.SCHEDULED_REFRESH_SECONDS
+    finally:
+        dashboard.scheduled_series.pop('TEST_SCHEDULED')
@@ -0,0 +1,34 @@
+# Point-in-time queries: series_as_of returns, per observation, the last value known on the as-of date.
+import pandas as pd
+
+
+def write_vintages(dashboard, series_id, rows):
+    with dashboard._store_connect() as conn:
+        vintage_table = dashboard._vintage_create(conn, series_id)
+        conn.executemany(f'INSERT INTO "{vintage_table}" (date, vintage, value) VALUES (?, ?, ?)', rows)
+
+
+def test_series_as_of_picks_last_known_vintage(dashboard):
+    write_vintages(dashboard, 'TEST_ASOF', [
+        ('2024-01-01', '2024-02-02', 100.0),
+        ('2024-01-01', '2024-03-08', 110.0),
+        ('2024-01-01', '2024-04-05', 112.0),
+        ('2024-02-01', '2024-03-08', 200.0),
+    ])
+    assert dashboard.series_as_of('TEST_ASOF', '2024-01-31').empty
+    feb = dashboard.series_as_of('TEST_ASOF', '2024-02-15')
+    assert feb['Date'].tolist() == [pd.Timestamp('2024-01-01')] and feb['Value'].tolist() == [100.0]
+    assert dashboard.series_as_of('TEST_ASOF', '2024-03-08')['Value'].tolist() == [110.0, 200.0]
+    assert dashboard.series_as_of('TEST_ASOF', '2024-12-31')['Value'].tolist() == [112.0, 200.0]
+
+
+def test_store_write_records_revisions_only(dashboard):
+    dates = pd.date_range('2024-01-01', periods=3, freq='MS')
+    dashboard.store_write('TEST_REVISIONS', pd.DataFrame({'Date': dates, 'Value': [1.0, 2.0, 3.0]}))
+    write_vintages(dashboard, 'TEST_REVISIONS', [('2024-02-01', '2000-01-01', 1.5)])
+    dashboard.store_write('TEST_REVISIONS', pd.DataFrame({'Date': dates, 'Value': [1.0, 2.5, 3.0]}))
+    today = pd.Timestamp.today().normalize()
+    assert dashboard.series_as_of('TEST_REVISIONS', '2000-01-01')['Value'].tolist() == [1.5]
+    assert dashboard.series_as_of('TEST_REVISIONS', today)['Value'].tolist() == [1.0, 2.5, 3.0]
+    revisions = dashboard.series_revisions('TEST_REVISIONS').set_index('Date')
+    assert revisions.loc['2024-02-01', 'Estimates'] == 2 and revisions.loc['2024-01-01', 'Estimates'] == 1
@@ -0,0 +1,47 @@
+# Typed-array wire format, sampled payload sizes and the columnar snapshot round trip.
+import base64
+
+import numpy as np
+import pandas as pd
+
+
+def decode(array):
+    return np.frombuffer(base64.b64decode(array['bdata']), dtype='<' + array['dtype'])
+
+
+def test_compact_figure_encodes_dates_as_epoch_ms_on_a_date_axis(dashboard):
+    df = pd.DataFrame({'Date': pd.date_range('2024-01-01', periods=4, freq='MS'), 'Value': [1.5, 2.0, np.nan, 3.25]})
+    payload = dashboard.compact_figure(dashboard.create_figure(df, 'Date', 'Value', ''))
+    trace = payload['data'][0]
+    assert decode(trace['x']).tolist() == (df['Date'].values.astype('datetime64[ms]').astype('int64')).astype(float).tolist()
+    np.testing.assert_array_equal(decode(trace['y']), df['Value'].to_numpy())
+    assert payload['layout']['xaxis']['type'] == 'date'
+
+
+def test_typed_array_uses_int32_when_values_fit(dashboard):
+    assert dashboard.typed_array(np.array([1, -2, 3]))['dtype'] == 'i4'
+    assert dashboard.typed_array(np.array([1, 2 ** 40]))['dtype'] == 'f8'
+    assert dashboard.typed_array(np.zeros((2, 3)))['shape'] == '2,3'
+
+
+def test_wire_figure_measures_sampled_payloads(dashboard, monkeypatch):
+    monkeypatch.setattr(dashboard, 'PAYLOAD_SAMPLE_RATE', 1)
+    payload = dashboard.wire_figure(dashboard.create_release_figure(), 'release')
+    assert 'data' in payload
+    metrics = dashboard.render_metrics()
+    assert 'dashboard_figure_payload_bytes_count{chart="release",encoding="json"}' in metrics
+    assert 'dashboard_figure_payload_bytes_count{chart="release",encoding="typed"}' in metrics
+
+
+def test_payload_sizes_reports_both_encodings(dashboard):
+    df = pd.DataFrame({'Date': pd.date_range('2000-01-01', periods=500, freq='W-SAT'), 'Value': np.linspace(0, 1, 500)})
+    sizes = dashboard.payload_sizes(dashboard.create_figure(df, 'Date', 'Value', ''))
+    assert 0 < sizes['typed'] < sizes['json']
+
+
+def test_snapshot_round_trips_columnar_frames(dashboard):
+    df = pd.DataFrame({'Date': pd.date_range('2020-01-01', periods=3, freq='MS'), 'CPI (YoY %)': [2.5, np.nan, 3.0]})
+    dashboard.save_snapshot({'cpi': df, '_status': {'cpi': 'stale'}})
+    frames = dashboard.load_snapshot()
+    assert frames['_status'] == {'cpi': 'stale'}
+    pd.testing.assert_frame_equal(frames['cpi'], df, check_dtype=False)
@@ -0,0 +1,41 @@
+# Large-series zoom: downsampled charts re-render the visible range at full resolution, small ones never
+# reach the server.
+import numpy as np
+import pandas as pd
+
+
+def claims_token(dashboard, points):
+    label = dashboard.indicators['claims']['label']
+    dates = pd.date_range('1990-01-06', periods=points, freq='W-SAT')
+    df = pd.DataFrame({'Date': dates, label: 200000 + np.cumsum(np.random.default_rng(0).normal(0, 1000, points))})
+    return dashboard.cache_put({'claims': df, '_status': {'claims': 'ok'}}, 120), df
+
+
+def point_count(fig):
+    return sum(len(trace.x) for trace in fig.data)
+
+
+def test_downsampled_chart_zoom_renders_visible_range_at_full_resolution(dashboard):
+    token, df = claims_token(dashboard, 3000)
+    assert dashboard.chart_downsampled('claims', token)
+    assert point_count(dashboard.build_chart_figure('claims', token)) <= dashboard.PIXEL_BUDGET
+    start, end = df['Date'].iloc[1000], df['Date'].iloc[1299]
+    fig = dashboard.zoom_figure('claims', token, {'xaxis.range[0]': str(start), 'xaxis.range[1]': str(end)})
+    assert point_count(fig) == 300
+    assert list(fig.layout.xaxis.range) == [str(start), str(end)]
+
+
+def test_downsampled_chart_zoom_reset_renders_full_frame(dashboard):
+    token, _ = claims_token(dashboard, 3000)
+    fig = dashboard.zoom_figure('claims', token, {'xaxis.autorange': True})
+    assert fig is not None
+    assert fig.layout.xaxis.range is None
+
+
+def test_small_chart_and_non_range_relayout_need_no_rerender(dashboard):
+    small, df = claims_token(dashboard, 520)
+    assert not dashboard.chart_downsampled('claims', small)
+    assert dashboard.zoom_figure('claims', small, {'xaxis.range[0]': str(df['Date'].iloc[0]), 'xaxis.range[1]': str(df['Date'].iloc[9])}) is None
+    large, _ = claims_token(dashboard, 3000)
+    assert dashboard.zoom_figure('claims', large, {'autosize': True}) is None
+    assert not dashboard.chart_downsampled('corr', large)